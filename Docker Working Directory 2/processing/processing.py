@@ -5,6 +5,7 @@ Created on Tue Apr 23 03:43:35 2024
 @author: Mohammad
 """
 
+import os
 import sys
 import time
 import json
@@ -16,6 +17,8 @@ import vector
 import numpy as np
 
 import infofile 
+import branches
+from publisher import Publisher
 
 # Constants
 lumi = 10  # fb-1 for all data
@@ -70,9 +73,7 @@ def read_file(path, sample):
         numevents = tree.num_entries
         if 'data' not in sample:
             xsec_weight = get_xsec_weight(sample)
-        for data in tree.iterate(['lep_pt', 'lep_eta', 'lep_phi', 'lep_E', 'lep_charge', 'lep_type',
-                                  'mcWeight', 'scaleFactor_PILEUP', 'scaleFactor_ELE', 'scaleFactor_MUON', 'scaleFactor_LepTRIGGER'],
-                                 library="ak", entry_stop=int(numevents * fraction)):
+        for data in tree.iterate(branches.plan(sample), library="ak", entry_stop=int(numevents * fraction)):
             if 'data' not in sample:
                 data['totalWeight'] = calc_weight(xsec_weight, data)
             data = data[~cut_lep_charge(data.lep_charge)]
@@ -101,18 +102,20 @@ class AwkwardJSONEncoder(json.JSONEncoder):
             return ak.to_list(obj)  # Convert awkward arrays to lists
         return super().default(obj)
 
+# One long-lived connection for everything this script publishes
+publisher = Publisher(pika.ConnectionParameters(host=os.getenv('RABBITMQ_HOST', 'rabbitmq'),
+                                                port=int(os.getenv('RABBITMQ_PORT', '5672'))),
+                      durable=False)  # The plotter declares plotting_queue non-durable
+
 def publish_data(data):
-    connection = pika.BlockingConnection(pika.ConnectionParameters('rabbitmq'))
-    channel = connection.channel()
-    channel.queue_declare(queue='plotting_queue')
     # Serialize data using the custom JSON encoder
     processed_data = json.dumps(data, cls=AwkwardJSONEncoder, indent=4)
-    channel.basic_publish(exchange='', routing_key='plotting_queue', body=processed_data)
-    connection.close()
+    publisher.publish('plotting_queue', processed_data)
     
 if __name__ == "__main__":
     start = time.time()
     data = get_data_from_files()
     publish_data(data)
+    publisher.close()
     elapsed = time.time() - start
     print(f"Time taken: {round(elapsed,1)}s")
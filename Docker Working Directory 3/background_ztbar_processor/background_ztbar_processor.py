@@ -11,12 +11,19 @@ import vector
 import pika
 import json
 import infofile
-from config import samples, tuple_path
+import codec
+import branches
+from concurrent.futures import ProcessPoolExecutor
+from publisher import Publisher
+from config import samples, tuple_path, workers
 
 # Constants for unit conversion
 MeV = 0.001
 GeV = 1.0
 
+# One connection to RabbitMQ for everything this process publishes
+publisher = Publisher()
+
 class CustomEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, ak.Array):
@@ -26,42 +33,21 @@ class CustomEncoder(json.JSONEncoder):
             return {'pt': o.pt, 'eta': o.eta, 'phi': o.phi, 'E': o.E}
         return json.JSONEncoder.default(self, o)
 
-def connect_to_rabbitmq():
-    """Establish a connection to RabbitMQ server."""
-    credentials = pika.PlainCredentials('user', 'password')  
-    parameters = pika.ConnectionParameters('rabbitmq', 5672, '/', credentials) 
-    return pika.BlockingConnection(parameters)
-
 def publish_data(data, queue_name):
     """Publish processed data to a specified RabbitMQ queue."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue=queue_name, durable=True)
-    body = json.dumps(data, cls=CustomEncoder)
-    channel.basic_publish(
-        exchange='',
-        routing_key=queue_name,
-        body=body,
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # make message persistent
-        ))
+    body, encoding = codec.compress(json.dumps(data, cls=CustomEncoder))
+    publisher.publish(queue_name, body, pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_encoding=encoding,
+    ))
     print(f"Data published to RabbitMQ queue {queue_name}")
-    connection.close()
-    
+
 def send_completion_message():
     """Send a completion message to RabbitMQ."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue='completion_queue', durable=True)
-    channel.basic_publish(
-        exchange='',
-        routing_key='completion_queue',
-        body='Processing completed',
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # Make message persistent
-        ))
+    publisher.publish('completion_queue', 'Processing completed', pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+    ))
     print("Sent completion message to RabbitMQ.")
-    connection.close()       
 
 def read_file(path, sample):
     """Read data from ROOT file, apply cuts, calculate mass, and gather data."""
@@ -71,10 +57,7 @@ def read_file(path, sample):
 
     with uproot.open(path + ":mini") as tree:
         numevents = tree.num_entries
-        for data in tree.iterate(['lep_pt', 'lep_eta', 'lep_phi', 'lep_E', 'lep_charge', 'lep_type',
-                                  'mcWeight', 'scaleFactor_PILEUP', 'scaleFactor_ELE', 'scaleFactor_MUON',
-                                  'scaleFactor_LepTRIGGER'],
-                                 library="ak", entry_stop=numevents):
+        for data in tree.iterate(branches.plan(sample), library="ak", entry_stop=numevents):
             
             data['totalWeight'] = calc_weight(data, sample)
             data = apply_cuts(data)
@@ -111,15 +94,20 @@ def calc_mllll(lep_pt, lep_eta, lep_phi, lep_E):
     p4 = vector.zip({"pt": lep_pt, "eta": lep_eta, "phi": lep_phi, "E": lep_E})
     return (p4[:, 0] + p4[:, 1] + p4[:, 2] + p4[:, 3]).mass * MeV
 
+def read_files(paths, sample_names):
+    """Read several files in parallel worker processes, returning the results in input order."""
+    if workers <= 1 or len(paths) <= 1:
+        return [read_file(path, sample) for path, sample in zip(paths, sample_names)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(read_file, paths, sample_names))
+
 def get_data_from_files():
     """Process all files and publish data to RabbitMQ."""
     data = {}
     print('Processing "Background $Z,t\bar{t}$" samples')
-    frames = []
-    for val in samples[r'Background $Z,t\bar{t}$']['list']:
-        fileString = tuple_path + "MC/mc_" + str(infofile.infos[val]["DSID"]) + "." + val + ".4lep.root"
-        temp = read_file(fileString, val)
-        frames.append(temp)
+    sample_names = samples[r'Background $Z,t\bar{t}$']['list']
+    paths = [tuple_path + "MC/mc_" + str(infofile.infos[val]["DSID"]) + "." + val + ".4lep.root" for val in sample_names]
+    frames = read_files(paths, sample_names)
     data[r'Background $Z,t\bar{t}$'] = ak.concatenate(frames)
     publish_data(data, "background_zt_data") 
     send_completion_message() 
@@ -128,5 +116,6 @@ def get_data_from_files():
 if __name__ == "__main__":
     start = time.time()
     data = get_data_from_files()
+    publisher.close()
     elapsed = time.time() - start
     print(f"Time taken: {round(elapsed, 1)}s")
@@ -11,6 +11,7 @@ from matplotlib.ticker import AutoMinorLocator
 import pika
 import json
 import awkward as ak
+import codec
 
 output_dir = '/app/output'
 # Constants for unit conversion
@@ -55,7 +56,7 @@ def start_consuming():
 
 def plot_callback(ch, method, properties, body):
     """Callback function to process received messages and plot data."""
-    data = json.loads(body)
+    data = json.loads(codec.decompress(body, properties))
     print("Plotting data...")
     plot_data(data)
 
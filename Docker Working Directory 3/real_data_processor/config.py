@@ -6,8 +6,13 @@ Created on Tue Apr 23 08:53:51 2024
 """
 
 # config.py
+import os
+
 tuple_path = "https://atlas-opendata.web.cern.ch/atlas-opendata/samples/2020/4lep/"
 
+# Number of worker processes reading files in parallel (1 reads them one at a time)
+workers = int(os.getenv('HZZ_WORKERS', str(os.cpu_count() or 1)))
+
 samples = {
     'data': {
         'list' : ['data_A','data_B','data_C','data_D'],
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Long-lived RabbitMQ publisher with windowed publisher confirms.
+
+A Publisher holds one connection and channel open for every message a process
+sends, instead of a fresh TCP and AMQP handshake per message. Each queue is
+declared once per connection, and a dropped connection is reopened with
+exponential backoff before the message is sent again. Given an exchange, each
+queue is also bound to it under its own name, and messages are routed through
+the exchange.
+
+With a confirm window the channel is put in confirm mode. Messages are sent
+without waiting for the broker, and the publisher only blocks once the window
+of unconfirmed messages is full. Nacked messages, and every message still
+unconfirmed when the connection drops, are sent again, so delivery is at least
+once. See publisher_benchmark.py for its throughput with confirms off, per
+message and windowed.
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pika
+
+
+def async_channel(channel):
+    """The asynchronous channel a BlockingChannel wraps, to publish and take confirms without blocking.
+
+    BlockingChannel.confirm_delivery waits for the broker on every message, so windowed confirms
+    go through the private _impl attribute, which every pika 1.x release has.
+    """
+    if not pika.__version__.startswith('1.'):
+        raise RuntimeError(f"Windowed publisher confirms need pika 1.x, not {pika.__version__}; "
+                           f"set HZZ_CONFIRM_WINDOW=0 to publish without them")
+    return channel._impl
+
+
+def connection_parameters():
+    """Broker address and credentials from the environment."""
+    credentials = pika.PlainCredentials(os.getenv('RABBITMQ_DEFAULT_USER', 'user'),
+                                        os.getenv('RABBITMQ_DEFAULT_PASS', 'password'))
+    return pika.ConnectionParameters(host=os.getenv('RABBITMQ_HOST', 'rabbitmq'),
+                                     port=int(os.getenv('RABBITMQ_PORT', '5672')),
+                                     virtual_host='/', credentials=credentials,
+                                     heartbeat=600)  # Publishes can be minutes apart
+
+
+class Publisher:
+    """One connection and channel reused for every message published by a process."""
+
+    def __init__(self, parameters=None, durable=True, retries=5, backoff=1.0, max_backoff=30.0,
+                 confirm_window=0, confirm_timeout=30.0, connection_class=pika.BlockingConnection,
+                 exchange='', queue_arguments=None):
+        self.parameters = parameters or connection_parameters()
+        self.durable = durable
+        self.exchange = exchange  # Topic exchange to route through, '' for the default exchange
+        self.queue_arguments = queue_arguments
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.confirm_window = confirm_window  # Unconfirmed messages allowed in flight, 0 disables confirms
+        self.confirm_timeout = confirm_timeout
+        self.connection_class = connection_class
+        self.connection = None
+        self.channel = None
+        self.confirm_channel = None  # Asynchronous channel under self.channel, in confirm mode
+        self.declared = set()
+        self.next_tag = 1
+        self.unconfirmed = OrderedDict()  # delivery tag -> (queue, body, properties, time sent)
+        self.nacked = []
+        self.publish_latencies = []
+        self.confirm_latencies = []
+        self.retransmitted = 0
+
+    def connect(self):
+        """Open the connection and channel, retrying with exponential backoff."""
+        delay = self.backoff
+        for _ in range(self.retries):
+            try:
+                self.connection = self.connection_class(self.parameters)
+                self.channel = self.connection.channel()
+                self.declared = set()
+                if self.exchange:
+                    self.channel.exchange_declare(exchange=self.exchange, exchange_type='topic', durable=True)
+                if self.confirm_window:
+                    self._select_confirms()
+                return self.channel
+            except pika.exceptions.AMQPConnectionError:
+                print(f"Failed to connect to RabbitMQ, retrying in {delay}s...")
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+        raise Exception("Failed to connect to RabbitMQ after multiple attempts.")
+
+    def _select_confirms(self):
+        # Confirm mode is set on the asynchronous channel, so acks are handled as they arrive
+        selected = []
+        self.confirm_channel = async_channel(self.channel)
+        self.confirm_channel.confirm_delivery(ack_nack_callback=self._on_confirm,
+                                            callback=lambda frame: selected.append(frame))
+        while not selected:
+            self.connection.process_data_events(time_limit=0.1)
+        self.next_tag = 1  # Delivery tags restart on every channel
+
+    def _on_confirm(self, frame):
+        """Retire the messages an ack or nack from the broker covers."""
+        tag, multiple = frame.method.delivery_tag, frame.method.multiple
+        tags = [t for t in self.unconfirmed if t <= tag] if multiple else [tag]
+        now = time.perf_counter()
+        for t in tags:
+            queue_name, body, properties, sent = self.unconfirmed.pop(t)
+            if isinstance(frame.method, pika.spec.Basic.Nack):
+                self.nacked.append((queue_name, body, properties))
+            else:
+                self.confirm_latencies.append(now - sent)
+
+    def ensure_channel(self):
+        """The open channel, reconnecting first if the connection was lost."""
+        if self.connection is None or not self.connection.is_open or not self.channel.is_open:
+            # Whatever the broker hadn't confirmed on the old channel may be lost
+            self.nacked += [message[:3] for message in self.unconfirmed.values()]
+            self.unconfirmed.clear()
+            self.connect()
+        return self.channel
+
+    def declare(self, queue_name):
+        """Declare queue_name unless it was already declared on this connection."""
+        if queue_name not in self.declared:
+            channel = self.ensure_channel()
+            channel.queue_declare(queue=queue_name, durable=self.durable, arguments=self.queue_arguments)
+            if self.exchange:
+                channel.queue_bind(queue=queue_name, exchange=self.exchange, routing_key=queue_name)
+            self.declared.add(queue_name)
+
+    def publish(self, queue_name, body, properties=None):
+        """Publish body to queue_name, waiting for confirms once the window is full."""
+        self._send(queue_name, body, properties)
+        if self.confirm_window:
+            self._process(0)  # Send it and take in any acks
+            self._retransmit()
+            while len(self.unconfirmed) >= self.confirm_window:
+                self._process(0.1)
+                self._retransmit()
+
+    def _send(self, queue_name, body, properties):
+        """Send one message, reconnecting once if the connection dropped since the last message."""
+        for attempt in range(2):
+            try:
+                channel = self.ensure_channel()
+                self.declare(queue_name)
+                start = time.perf_counter()
+                if self.confirm_window:
+                    self.confirm_channel.basic_publish(exchange=self.exchange, routing_key=queue_name, body=body, properties=properties)
+                    self.unconfirmed[self.next_tag] = (queue_name, body, properties, start)
+                    self.next_tag += 1
+                else:
+                    channel.basic_publish(exchange=self.exchange, routing_key=queue_name, body=body, properties=properties)
+                self.publish_latencies.append(time.perf_counter() - start)
+                break
+            except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError):
+                if attempt:
+                    raise
+                print("Lost connection to RabbitMQ, reconnecting...")
+                self.connection = None
+
+    def _process(self, time_limit):
+        """Take in acks from the broker, reconnecting if the connection dropped."""
+        try:
+            self.connection.process_data_events(time_limit=time_limit)
+        except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError):
+            print("Lost connection to RabbitMQ, reconnecting...")
+            self.connection = None
+            self.ensure_channel()
+
+    def _retransmit(self):
+        """Send nacked messages and messages lost with a connection again, in a loop so a nack storm can't recurse."""
+        while self.nacked:
+            queue_name, body, properties = self.nacked.pop(0)
+            self.retransmitted += 1
+            self._send(queue_name, body, properties)
+            while len(self.unconfirmed) >= self.confirm_window:
+                self._process(0.1)
+
+    def flush(self):
+        """Wait until the broker has confirmed every message, sending lost ones again."""
+        if not self.confirm_window or self.connection is None:
+            return
+        for _ in range(self.retries):
+            deadline = time.perf_counter() + self.confirm_timeout
+            while self.unconfirmed and time.perf_counter() < deadline:
+                self._process(0.1)
+                self._retransmit()
+            self._retransmit()
+            if not self.unconfirmed:
+                return
+            print(f"{len(self.unconfirmed)} messages unconfirmed after {self.confirm_timeout}s, sending them again...")
+            self.nacked += [message[:3] for message in self.unconfirmed.values()]
+            self.unconfirmed.clear()
+        raise Exception("RabbitMQ did not confirm every message after multiple attempts.")
+
+    def close(self):
+        """Wait for outstanding confirms, then close the connection if it is open."""
+        self.flush()
+        if self.connection is not None and self.connection.is_open:
+            self.connection.close()
+        self.connection = None
+
+    def stats(self):
+        """Message count, retransmissions and publish/confirm latency percentiles in milliseconds."""
+        stats = {'published': len(self.publish_latencies), 'retransmitted': self.retransmitted}
+        for name, latencies in (('publish', self.publish_latencies), ('confirm', self.confirm_latencies)):
+            if latencies:
+                p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+                stats[name] = {'p50_ms': round(float(p50), 3), 'p99_ms': round(float(p99), 3)}
+        return stats
@@ -10,12 +10,19 @@ import awkward as ak
 import vector
 import pika
 import json
-from config import samples, tuple_path
+import codec
+import branches
+from concurrent.futures import ProcessPoolExecutor
+from publisher import Publisher
+from config import samples, tuple_path, workers
 
 # Constants
 MeV = 0.001
 GeV = 1.0
 
+# One connection to RabbitMQ for everything this process publishes
+publisher = Publisher()
+
 class CustomEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, ak.Array):
@@ -25,42 +32,21 @@ class CustomEncoder(json.JSONEncoder):
             return {'pt': o.pt, 'eta': o.eta, 'phi': o.phi, 'E': o.E}
         return json.JSONEncoder.default(self, o)
 
-def connect_to_rabbitmq():
-    """Establish a connection to RabbitMQ server."""
-    credentials = pika.PlainCredentials('user', 'password') 
-    parameters = pika.ConnectionParameters('rabbitmq', 5672, '/', credentials)  
-    return pika.BlockingConnection(parameters)
-
 def publish_data(data, queue_name):
     """Publish processed data to a specified RabbitMQ queue."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue=queue_name, durable=True)
-    body = json.dumps(data, cls=CustomEncoder)
-    channel.basic_publish(
-        exchange='',
-        routing_key=queue_name,
-        body=body,
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # Make message persistent
-        ))
+    body, encoding = codec.compress(json.dumps(data, cls=CustomEncoder))
+    publisher.publish(queue_name, body, pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_encoding=encoding,
+    ))
     print(f"Data published to RabbitMQ queue {queue_name}")
-    connection.close()
-    
+
 def send_completion_message():
     """Send a completion message to RabbitMQ."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue='completion_queue', durable=True)
-    channel.basic_publish(
-        exchange='',
-        routing_key='completion_queue',
-        body='Processing completed',
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # Make message persistent
-        ))
+    publisher.publish('completion_queue', 'Processing completed', pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+    ))
     print("Sent completion message to RabbitMQ.")
-    connection.close()   
 
 def read_file(path, sample):
     print(f"\tProcessing: {sample}")
@@ -69,8 +55,7 @@ def read_file(path, sample):
 
     with uproot.open(path + ":mini") as tree:
         numevents = tree.num_entries
-        for data in tree.iterate(['lep_pt', 'lep_eta', 'lep_phi', 'lep_E', 'lep_charge', 'lep_type'],
-                                 library="ak", entry_stop=numevents):
+        for data in tree.iterate(branches.plan(sample), library="ak", entry_stop=numevents):
             data = apply_cuts(data)
             data['mllll'] = calc_mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'])
             data_all.append(data)
@@ -89,14 +74,19 @@ def calc_mllll(lep_pt, lep_eta, lep_phi, lep_E):
     p4 = vector.zip({"pt": lep_pt, "eta": lep_eta, "phi": lep_phi, "E": lep_E})
     return (p4[:, 0] + p4[:, 1] + p4[:, 2] + p4[:, 3]).mass * MeV
 
+def read_files(paths, sample_names):
+    """Read several files in parallel worker processes, returning the results in input order."""
+    if workers <= 1 or len(paths) <= 1:
+        return [read_file(path, sample) for path, sample in zip(paths, sample_names)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(read_file, paths, sample_names))
+
 def get_data_from_files():
     data = {}
     print('Processing "data" samples')
-    frames = []
-    for val in samples['data']['list']:
-        fileString = tuple_path + "Data/" + val + ".4lep.root"
-        temp = read_file(fileString, val)
-        frames.append(temp)
+    sample_names = samples['data']['list']
+    paths = [tuple_path + "Data/" + val + ".4lep.root" for val in sample_names]
+    frames = read_files(paths, sample_names)
     data['data'] = ak.concatenate(frames)
     publish_data(data['data'], 'real_data_queue')  
     send_completion_message() 
@@ -105,5 +95,6 @@ def get_data_from_files():
 if __name__ == "__main__":
     start = time.time()
     data = get_data_from_files()
+    publisher.close()
     elapsed = time.time() - start
     print(f"Time taken: {round(elapsed, 1)}s")
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Stage-level timing of the pipeline.
+
+Every stage (open, read, cut, mass, concatenate, serialize, publish, consume,
+render) records its wall time, thread CPU time, events in and out and bytes moved,
+tagged with the service, sample and chunk. For read and cut the chunk is the
+first entry of the basket cluster, for mass it is the chunk's position in the
+file. Records are appended to a JSON lines file, and running totals per stage
+and sample can be scraped as Prometheus text.
+"""
+
+import os
+import json
+import time
+import socket
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+metrics_file = os.getenv('HZZ_METRICS_FILE', '')  # JSON lines output, empty to disable
+metrics_port = int(os.getenv('HZZ_METRICS_PORT', '0'))  # Prometheus text endpoint, 0 to disable
+service = os.getenv('HZZ_SERVICE', socket.gethostname())
+
+COUNTERS = ('calls', 'wall', 'cpu', 'events_in', 'events_out', 'bytes')
+
+_totals = {}  # (stage, sample) -> summed COUNTERS
+_lock = threading.Lock()
+_collected = None  # Records of the current traced call in a worker process
+
+
+@contextmanager
+def stage(name, sample=None, chunk=None, events_in=None):
+    """Time the body of the with block; it can fill in events_out and bytes of the yielded record.
+
+    CPU time is that of the calling thread, so stages running side by side on a
+    thread pool don't count each other's work. A stage that raises is still
+    recorded, with the exception in its error field.
+    """
+    record = {'service': service, 'stage': name, 'sample': sample, 'chunk': chunk,
+              'events_in': events_in, 'events_out': None, 'bytes': None, 'error': None}
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield record
+    except BaseException as e:
+        record['error'] = repr(e)
+        raise
+    finally:
+        record['wall'] = time.perf_counter() - wall
+        record['cpu'] = time.thread_time() - cpu
+        record['time'] = time.time()
+        _write(record)
+        merge([record])
+
+
+def _write(record):
+    if not metrics_file:
+        return
+    os.makedirs(os.path.dirname(metrics_file) or '.', exist_ok=True)
+    # One short append per record, so lines from concurrent processes don't interleave
+    with open(metrics_file, 'a') as out:
+        out.write(json.dumps(record, default=str) + '\n')
+
+
+def merge(records):
+    """Add records to the running totals, e.g. ones returned by a traced call in a worker process."""
+    with _lock:
+        if _collected is not None:
+            _collected.extend(records)
+        for record in records:
+            totals = _totals.setdefault((record['stage'], record['sample']), dict.fromkeys(COUNTERS, 0))
+            totals['calls'] += 1
+            for counter in COUNTERS[1:]:
+                totals[counter] += record[counter] or 0
+
+
+def _call_traced(function, *args):
+    global _collected
+    _collected = []
+    try:
+        return function(*args), _collected
+    finally:
+        _collected = None
+
+
+def traced(function):
+    """Picklable wrapper returning (result, stage records) of function, for process pools."""
+    return functools.partial(_call_traced, function)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text():
+    """Running totals in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        totals = {key: dict(value) for key, value in _totals.items()}
+    for counter in COUNTERS:
+        unit = '_seconds' if counter in ('wall', 'cpu') else ''
+        metric = f"hzz_stage_{counter}{unit}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for (name, sample), values in sorted(totals.items(), key=str):
+            lines.append(f'{metric}{{service="{_label(service)}",stage="{_label(name)}",'
+                         f'sample="{_label(sample or "")}"}} {values[counter]}')
+    return '\n'.join(lines) + '\n'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the service log
+
+
+def serve(port=None):
+    """Serve the totals over HTTP from a background thread, if a port is configured."""
+    port = metrics_port if port is None else port
+    if not port:
+        return None
+    server = ThreadingHTTPServer(('', port), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving stage metrics on port {port}")
+    return server
+
+
+def report():
+    """Print the totals of every stage, slowest first."""
+    per_stage = {}
+    with _lock:
+        for (name, _), values in _totals.items():
+            totals = per_stage.setdefault(name, dict.fromkeys(COUNTERS, 0))
+            for counter in COUNTERS:
+                totals[counter] += values[counter]
+    for name, totals in sorted(per_stage.items(), key=lambda item: -item[1]['wall']):
+        print(f"\t{name:<12} {totals['wall']:8.2f}s wall {totals['cpu']:8.2f}s cpu "
+              f"{totals['events_in']:>10} in {totals['events_out']:>10} out "
+              f"{totals['bytes'] / 1e6:10.1f} MB in {totals['calls']} calls")
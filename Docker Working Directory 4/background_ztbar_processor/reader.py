@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Two-phase reading of the 4lep ntuples.
+
+The cheap selection branches are read first, one cluster at a time, and the
+expensive branches are only decompressed for the entry range of each cluster
+that still holds events passing the selection.
+"""
+
+import numpy as np
+import awkward as ak
+
+import metrics
+
+
+def cluster_ranges(tree, entry_start=0, entry_stop=None):
+    """(entry_start, entry_stop) of every basket cluster shared by all branches."""
+    offsets = tree.common_entry_offsets()
+    entry_stop = tree.num_entries if entry_stop is None else min(int(entry_stop), tree.num_entries)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        if start >= entry_stop:
+            break
+        if stop > entry_start:
+            yield max(start, entry_start), min(stop, entry_stop)
+
+
+def bytes_read(tree):
+    """Bytes requested from the tree's file so far, or 0 if its source doesn't count them."""
+    return getattr(tree.file.source, 'num_requested_bytes', 0)
+
+
+def iterate_selected(tree, selection_branches, payload_branches, mask_func, entry_start=0, entry_stop=None,
+                     sample=None):
+    """Yield events passing mask_func, reading payload_branches only where they are needed."""
+    selection_branches = list(selection_branches)
+    payload_branches = [b for b in payload_branches if b not in selection_branches]
+    n_clusters = n_skipped = 0
+    for start, stop in cluster_ranges(tree, entry_start, entry_stop):
+        n_clusters += 1
+        with metrics.stage('read', sample, start, stop - start) as record:
+            before = bytes_read(tree)
+            selection = tree.arrays(selection_branches, entry_start=start, entry_stop=stop, library="ak")
+            record['events_out'], record['bytes'] = len(selection), bytes_read(tree) - before
+        with metrics.stage('cut', sample, start, len(selection)) as record:
+            passing = np.flatnonzero(ak.to_numpy(mask_func(selection)))
+            record['events_out'] = len(passing)
+        if len(passing) == 0:
+            n_skipped += 1
+            continue
+
+        # Only decompress the payload between the first and last passing event
+        first, last = passing[0], passing[-1] + 1
+        with metrics.stage('read', sample, start, last - first) as record:
+            before = bytes_read(tree)
+            data = tree.arrays(payload_branches, entry_start=start + first, entry_stop=start + last, library="ak")
+            record['events_out'], record['bytes'] = len(data), bytes_read(tree) - before
+        for name in selection_branches:
+            data[name] = selection[name][first:last]
+        yield data[passing - first]
+
+    if n_skipped == n_clusters:
+        # Keep the output typed even when no event passes
+        data = tree.arrays(payload_branches + selection_branches, entry_start=0, entry_stop=0, library="ak")
+        yield data
+    print(f"\tSkipped {n_skipped}/{n_clusters} clusters with no passing events")
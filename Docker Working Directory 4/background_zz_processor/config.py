@@ -6,7 +6,33 @@ Created on Tue Apr 23 08:53:51 2024
 """
 
 # config.py
-tuple_path = "https://atlas-opendata.web.cern.ch/atlas-opendata/samples/2020/4lep/"
+import os
+import time
+import uuid
+
+tuple_path = os.getenv('TUPLE_PATH', "https://atlas-opendata.web.cern.ch/atlas-opendata/samples/2020/4lep/")
+
+# Local cache of the remote ROOT files (see filecache.py)
+cache_dir = os.getenv('HZZ_CACHE_DIR', '/app/cache')
+cache_max_bytes = int(os.getenv('HZZ_CACHE_MAX_BYTES', str(20 * 1024**3)))  # 20 GiB
+
+# Parquet skims of post-selection events (see skimcache.py), empty to disable
+skim_dir = os.getenv('HZZ_SKIM_DIR', '/app/cache/skims')
+
+# Number of worker processes reading files in parallel (1 reads them one at a time)
+workers = int(os.getenv('HZZ_WORKERS', str(os.cpu_count() or 1)))
+
+# Identifies the analysis run, so results and completion messages of different runs are never mixed. Every
+# service of a run must be given the same id; left unset, a new one is generated, so nothing left on the broker
+# by an earlier run is ever counted towards this one
+run_id = os.getenv('HZZ_RUN_ID') or time.strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:8]
+
+# Position of this replica among the replicas of its service (see shards.py)
+shard_index = int(os.getenv('SHARD_INDEX', '1')) - 1  # Swarm task slots count from 1
+shard_count = int(os.getenv('SHARD_COUNT', '1'))
+if not 0 <= shard_index < shard_count:
+    # A replica outside the count would read nothing while the plotter waits for it, or repeat another's slice
+    raise ValueError(f"SHARD_INDEX {shard_index + 1} is outside 1..{shard_count}, set SHARD_COUNT to the number of replicas")
 
 samples = {
     'data': {
@@ -25,3 +51,55 @@ samples = {
         'color' : "#00cdff" # light blue
     },
 }
+
+# Integrated luminosity of each data period in fb^-1. Simulated weights are normalised to weight_lumi,
+# and the plotter scales them to the luminosity of the periods it plots
+lumi_periods = {'data_A': 0.5, 'data_B': 1.9, 'data_C': 2.9, 'data_D': 4.7}
+weight_lumi = 1
+
+# Compute engine for cuts, weights and mass: 'awkward' (awkward/vector), 'numpy' (see kernels.py)
+# or 'numba' (see jitkernels.py, falls back to 'numpy' where numba isn't installed)
+engine = os.getenv('HZZ_ENGINE', 'awkward')
+
+# 'events' publishes the selected events, 'histograms' only their filled mllll histograms (see histograms.py)
+output_mode = os.getenv('HZZ_OUTPUT_MODE', 'events')
+
+# Format of streamed event batches: 'wire' sends only mllll, totalWeight and the HZZ_EXTRA_COLUMNS branches
+# as typed buffers (see wire.py), 'arrow' every selected branch as an Arrow record batch
+wire_format = os.getenv('HZZ_WIRE_FORMAT', 'wire')
+extra_columns = [name for name in os.getenv('HZZ_EXTRA_COLUMNS', '').split(',') if name]
+
+# Events per Arrow record batch when streaming events to the plotter (see stream.py)
+batch_size = int(os.getenv('HZZ_BATCH_SIZE', '100000'))
+
+# Blob store the event batches are written to, publishing only claim-check references (see claimcheck.py),
+# e.g. file:///app/blobs on a volume shared with the plotter. Empty sends the batches through RabbitMQ.
+blob_store = os.getenv('HZZ_BLOB_STORE', '')
+
+# Published messages the broker may leave unconfirmed before a publisher waits (see publisher.py), 0 disables confirms
+confirm_window = int(os.getenv('HZZ_CONFIRM_WINDOW', '64'))
+
+# Queue each sample group's results are published to
+result_queues = {
+    'data': 'real_data_queue',
+    r'Background $Z,t\bar{t}$': 'background_zt_data',
+    r'Background $ZZ^*$': 'background_zz_queue',
+    r'Signal ($m_H$ = 125 GeV)': 'signal_data_queue',
+}
+
+# Results are routed through a topic exchange to queues named '<run_id>.<queue>', so runs sharing a broker
+# never see each other's messages. Producers announce each new run on runs_queue, and queues nobody has
+# used for queue_expires_ms are deleted by the broker.
+results_exchange = 'hzz'
+runs_queue = 'runs'
+queue_expires_ms = int(os.getenv('HZZ_QUEUE_EXPIRES_MS', str(24 * 3600 * 1000)))  # 1 day
+queue_arguments = {'x-expires': queue_expires_ms}
+
+def run_queue(run, queue_name):
+    """Name of queue_name scoped to a run."""
+    return f"{run}.{queue_name}"
+
+# Work queue mode, where the dispatcher splits every sample into tasks for generic workers
+task_queue = 'task_queue'
+task_entries = int(os.getenv('HZZ_TASK_ENTRIES', '250000'))  # Entries per task, rounded up to whole basket clusters
+task_retries = int(os.getenv('HZZ_TASK_RETRIES', '2'))  # Times a failed task is queued again before it is reported failed
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Branch planner for the 4lep ntuples.
+
+Works out the smallest set of branches a sample needs from the cuts, weights and
+observables in use, so no processor reads or decompresses columns it ignores.
+Collision data carries no Monte Carlo weights, so data files never fetch them.
+"""
+
+# Branches needed by each cut
+CUT_BRANCHES = {
+    'lep_charge': ['lep_charge'],  # Sum of lepton charges is zero
+    'lep_type': ['lep_type'],  # eeee, mumumumu or eemumu
+}
+
+# Branches needed to compute each observable
+OBSERVABLE_BRANCHES = {
+    'mllll': ['lep_pt', 'lep_eta', 'lep_phi', 'lep_E'],
+}
+
+# Cuts, observables and per-event weight factors used by the analysis
+CUTS = ['lep_charge', 'lep_type']
+OBSERVABLES = ['mllll']
+WEIGHTS = ['mcWeight', 'scaleFactor_PILEUP', 'scaleFactor_ELE', 'scaleFactor_MUON', 'scaleFactor_LepTRIGGER']
+
+
+def is_data(sample):
+    """Collision data samples are named data_A, data_B, ..."""
+    return 'data' in sample
+
+
+def _unique(names):
+    """Drop repeated branch names, keeping the first occurrence."""
+    return list(dict.fromkeys(names))
+
+
+def selection_branches(cuts=CUTS):
+    """Branches read to evaluate the event selection."""
+    return _unique(branch for cut in cuts for branch in CUT_BRANCHES[cut])
+
+
+def payload_branches(sample, cuts=CUTS, observables=OBSERVABLES, weights=WEIGHTS):
+    """Branches read for events passing the selection."""
+    names = [branch for observable in observables for branch in OBSERVABLE_BRANCHES[observable]]
+    if not is_data(sample):
+        names += weights
+    selection = selection_branches(cuts)
+    return [name for name in _unique(names) if name not in selection]
+
+
+def plan(sample, cuts=CUTS, observables=OBSERVABLES, weights=WEIGHTS):
+    """Every branch sample needs, selection branches first."""
+    return selection_branches(cuts) + payload_branches(sample, cuts, observables, weights)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Splits every sample into entry-range tasks and queues them for the workers.
+"""
+
+import json
+import time
+import pika
+import shards
+import infofile
+from publisher import Publisher
+from config import samples, tuple_path, run_id, task_queue, task_entries, confirm_window
+
+def input_path(group, val):
+    """URL of the ROOT file holding sample val."""
+    if group == 'data':
+        return tuple_path + "Data/" + val + ".4lep.root"
+    return tuple_path + "MC/mc_" + str(infofile.infos[val]["DSID"]) + "." + val + ".4lep.root"
+
+def split_file(path, max_entries=task_entries):
+    """Cluster-aligned (entry_start, entry_stop) ranges of about max_entries entries each."""
+    offsets = shards.cluster_offsets(path)
+    ranges = []
+    start = offsets[0]
+    for stop in offsets[1:]:
+        if stop - start >= max_entries or stop == offsets[-1]:
+            ranges.append((start, stop))
+            start = stop
+    return ranges or [(0, 0)]
+
+def build_tasks():
+    """Every task of every sample group, largest first."""
+    tasks = []
+    for group, sample in samples.items():
+        group_tasks = []
+        for val in sample['list']:
+            path = input_path(group, val)
+            for entry_start, entry_stop in split_file(path):
+                group_tasks.append({'run_id': run_id, 'group': group, 'sample': val, 'path': path,
+                                    'entry_start': entry_start, 'entry_stop': entry_stop})
+        # The workers tag their results with these so a group's consumer knows when it has them all
+        for index, task in enumerate(group_tasks):
+            task['task_index'] = index
+            task['task_count'] = len(group_tasks)
+        print(f"Split {group} into {len(group_tasks)} tasks")
+        tasks += group_tasks
+
+    # Start the largest tasks first so no long task is left running at the end
+    tasks.sort(key=lambda task: task['entry_stop'] - task['entry_start'], reverse=True)
+    return tasks
+
+def dispatch_tasks(tasks):
+    """Publish the tasks to the work queue."""
+    publisher = Publisher(confirm_window=confirm_window)
+    for task in tasks:
+        publisher.publish(task_queue, json.dumps(task), pika.BasicProperties(
+            delivery_mode=2,  # Make message persistent
+            content_type='application/json',
+        ))
+    print(f"Dispatched {len(tasks)} tasks to RabbitMQ queue {task_queue}")
+    publisher.close()
+
+if __name__ == "__main__":
+    start = time.time()
+    dispatch_tasks(build_tasks())
+    elapsed = time.time() - start
+    print(f"Time taken: {round(elapsed, 1)}s")
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Numba compute engine for the selection, weight and mass of a chunk.
+
+The same interface as kernels.py, but each step is one compiled loop over the
+flat lepton buffers and their offsets: the charge and flavour sums of every
+event are taken in a single walk, the weight factors are multiplied into the
+output in place, and the four-momentum of the first four leptons is summed
+lepton by lepton, so no per-step array is built. Compiled kernels are cached
+next to this file, so only the first process to use a signature pays for it.
+
+numba is optional. Without it the NumPy kernels run instead.
+
+Run this file to check it against the awkward/vector path and the NumPy
+kernels, and to benchmark all three.
+"""
+
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+import kernels
+from kernels import MeV, LEP_TYPE_SUMS
+
+try:
+    import numba
+except ImportError:  # Only needed for HZZ_ENGINE=numba
+    numba = None
+
+available = numba is not None
+
+
+def _jit(function):
+    """Compile function with numba when it is installed; it stays plain Python otherwise."""
+    return numba.njit(cache=True, nogil=True)(function) if available else function
+
+
+@_jit
+def _cut_kernel(charge, charge_starts, lep_type, type_starts, counts, type_sums, out):
+    for event in range(len(counts)):
+        charge_sum = 0
+        type_sum = 0
+        for lepton in range(counts[event]):
+            charge_sum += charge[charge_starts[event] + lepton]
+            type_sum += lep_type[type_starts[event] + lepton]
+        out[event] = (charge_sum == 0 and
+                      (type_sum == type_sums[0] or type_sum == type_sums[1] or type_sum == type_sums[2]))
+
+
+@_jit
+def _multiply_kernel(out, factor, events, use_events):
+    for row in range(len(out)):
+        out[row] *= factor[events[row] if use_events else row]
+
+
+@_jit
+def _mass_kernel(pt, pt_starts, eta, eta_starts, phi, phi_starts, E, E_starts, events, use_events, scale, out):
+    for row in range(len(out)):
+        event = events[row] if use_events else row
+        px = py = pz = energy = 0.0
+        for lepton in range(4):
+            lepton_pt = np.float64(pt[pt_starts[event] + lepton])
+            lepton_eta = np.float64(eta[eta_starts[event] + lepton])
+            lepton_phi = np.float64(phi[phi_starts[event] + lepton])
+            px += lepton_pt * np.cos(lepton_phi)
+            py += lepton_pt * np.sin(lepton_phi)
+            pz += lepton_pt * np.sinh(lepton_eta)
+            energy += np.float64(E[E_starts[event] + lepton])
+        out[row] = np.sqrt(energy * energy - px * px - py * py - pz * pz) * scale  # NaN below the mass shell
+
+
+def _events(events):
+    """Events argument of the kernels: the selected events, or an empty array and False for every event."""
+    if events is None:
+        return np.zeros(0, dtype=np.intp), False
+    return np.asarray(events, dtype=np.intp), True
+
+
+def cut_mask(data):
+    """Events with zero total charge and an eeee, eemumu or mumumumu flavour sum, which takes at least 4 leptons."""
+    if not available:
+        return kernels.cut_mask(data)
+    charge, charge_starts, counts = kernels._flat(data['lep_charge'])
+    lep_type, type_starts, _ = kernels._flat(data['lep_type'])
+    out = np.empty(len(counts), dtype=np.bool_)
+    _cut_kernel(charge, charge_starts, lep_type, type_starts, counts,
+                np.array(LEP_TYPE_SUMS, dtype=np.int64), out)
+    return out
+
+
+def total_weight(data, xsec_weight, weights, events=None):
+    """Cross-section weight times every per-event weight factor."""
+    if not available:
+        return kernels.total_weight(data, xsec_weight, weights, events)
+    events, use_events = _events(events)
+    out = np.full(len(events) if use_events else len(data), xsec_weight, dtype=np.float64)
+    for name in weights:
+        _multiply_kernel(out, ak.to_numpy(data[name]), events, use_events)
+    return out
+
+
+def mllll(lep_pt, lep_eta, lep_phi, lep_E, dtype=np.float64, events=None):
+    """Invariant mass of the first four leptons in GeV."""
+    if not available:
+        return kernels.mllll(lep_pt, lep_eta, lep_phi, lep_E, dtype, events)
+    pt, pt_starts, _ = kernels._flat(lep_pt)
+    eta, eta_starts, _ = kernels._flat(lep_eta)
+    phi, phi_starts, _ = kernels._flat(lep_phi)
+    E, E_starts, _ = kernels._flat(lep_E)
+    events, use_events = _events(events)
+    out = np.empty(len(events) if use_events else len(pt_starts), dtype=dtype)
+    _mass_kernel(pt, pt_starts, eta, eta_starts, phi, phi_starts, E, E_starts, events, use_events, MeV, out)
+    return out
+
+
+def weight_and_mass(data, xsec_weight=None, weights=(), dtype=np.float64, events=None):
+    """totalWeight (None for collision data) and mllll of events that passed the cuts."""
+    weight = None if xsec_weight is None else total_weight(data, xsec_weight, weights, events)
+    return weight, mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'], dtype, events)
+
+
+def fused(data, xsec_weight=None, weights=(), dtype=np.float64):
+    """Selection mask, and totalWeight and mllll of the passing events, in one pass over the chunk."""
+    mask = cut_mask(data)
+    weight, mass = weight_and_mass(data, xsec_weight, weights, dtype, np.flatnonzero(mask))
+    return mask, weight, mass
+
+
+def benchmark(data, repeats=5):
+    """Time the awkward/vector path, the NumPy kernels and the numba kernels on one chunk, checking they agree."""
+    weights = [name for name in ('mcWeight', 'scaleFactor_PILEUP') if name in data.fields]
+    fused(data[:10], 0.5, weights)  # Compile, or load the cached kernels, outside the timings
+
+    def best_time(function):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = function()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    reference_time, (reference_mask, reference_weight, reference_mass) = best_time(
+        lambda: kernels._reference(data, 0.5, weights))
+    numpy_time, _ = best_time(lambda: kernels.fused(data, 0.5, weights))
+    jit_time, (mask, weight, mass) = best_time(lambda: fused(data, 0.5, weights))
+
+    assert np.array_equal(ak.to_numpy(reference_mask), mask)
+    assert np.allclose(ak.to_numpy(reference_weight), weight, rtol=1e-6)
+    assert np.allclose(ak.to_numpy(reference_mass), mass, rtol=1e-4, equal_nan=True)
+    engine = 'numba' if available else 'numba (not installed, NumPy)'
+    print(f"{len(data)} events: awkward/vector {reference_time * 1000:.1f} ms, numpy {numpy_time * 1000:.1f} ms, "
+          f"{engine} {jit_time * 1000:.1f} ms, speedup x{reference_time / jit_time:.1f}")
+
+
+if __name__ == "__main__":
+    # python jitkernels.py [ROOT file] checks and benchmarks on the tree in the file, or on random chunks
+    if len(sys.argv) > 1:
+        import uproot
+        with uproot.open(sys.argv[1] + ":mini") as tree:
+            for chunk in tree.iterate(library="ak"):
+                benchmark(chunk)
+    else:
+        for n_events in (10_000, 100_000, 1_000_000):
+            benchmark(kernels._random_chunk(n_events))
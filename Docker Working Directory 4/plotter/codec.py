@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Compression of message bodies.
+
+Producers compress each result body with the codec named by HZZ_CODEC (zstd,
+lz4, zlib or none) at level HZZ_CODEC_LEVEL, and name the codec in the
+message's content_encoding header. Consumers pass the message properties to
+decompress, so bodies sent with any codec, or none, are read the same way; a
+content_encoding that names no codec is an error.
+
+Run this file to compare the ratio and throughput of every codec and level on
+the selected events of a 4lep file, serialized as JSON, Arrow and the wire
+format.
+"""
+
+import os
+import sys
+import time
+import zlib
+import json
+
+import pika
+
+try:
+    import zstandard
+except ImportError:  # Only needed to send or receive zstd bodies
+    zstandard = None
+try:
+    import lz4.frame
+except ImportError:  # Only needed to send or receive lz4 bodies
+    lz4 = None
+
+default_codec = os.getenv('HZZ_CODEC', 'none')
+default_level = int(os.getenv('HZZ_CODEC_LEVEL')) if os.getenv('HZZ_CODEC_LEVEL') else None  # None for the codec's own
+
+
+def _zstd(level):
+    return zstandard.ZstdCompressor(level=3 if level is None else level)
+
+
+# name -> (compress(body, level), decompress(body), levels compared by the benchmark)
+CODECS = {
+    'zstd': (lambda body, level: _zstd(level).compress(body),
+             lambda body: zstandard.ZstdDecompressor().decompress(body), (1, 3, 9, 19)),
+    'lz4': (lambda body, level: lz4.frame.compress(body, compression_level=level or 0),
+            lambda body: lz4.frame.decompress(body), (0, 9)),
+    'zlib': (lambda body, level: zlib.compress(body, 6 if level is None else level),
+             zlib.decompress, (1, 6)),
+}
+
+
+def available():
+    """Codecs whose library is installed."""
+    installed = {'zstd': zstandard is not None, 'lz4': lz4 is not None, 'zlib': True}
+    return [name for name in CODECS if installed[name]]
+
+
+def compress(body, name=None, level=None):
+    """Compressed body and the content_encoding to send it with, None when it goes uncompressed."""
+    name = default_codec if name is None else name
+    level = default_level if level is None else level
+    if name == 'none':
+        return body, None
+    if name not in available():
+        raise ValueError(f"Codec {name} is not available, choose one of {available() + ['none']}")
+    if isinstance(body, str):
+        body = body.encode()
+    return CODECS[name][0](body, level), name
+
+
+def decompress(body, properties):
+    """Body of a message as it was before compression, given the message's properties."""
+    encoding = getattr(properties, 'content_encoding', None)
+    if not encoding:
+        return body  # Sent uncompressed
+    if encoding not in CODECS:
+        raise ValueError(f"Received a body with unknown content_encoding {encoding!r}, expected one of {list(CODECS)}")
+    if encoding not in available():
+        raise ValueError(f"Received a {encoding} body, but the library for it is not installed")
+    return CODECS[encoding][1](body)
+
+
+def _payloads(path, entry_stop=None):
+    """Selected events of a 4lep file serialized as the services send them."""
+    import uproot
+    import awkward as ak
+    import vector
+
+    with uproot.open(path + ":mini") as tree:
+        data = tree.arrays(library="ak", entry_stop=entry_stop)
+    type_sum = ak.sum(data['lep_type'], axis=1)
+    data = data[(ak.sum(data['lep_charge'], axis=1) == 0) & ((type_sum == 44) | (type_sum == 48) | (type_sum == 52))]
+    p4 = vector.zip({"pt": data['lep_pt'], "eta": data['lep_eta'], "phi": data['lep_phi'], "E": data['lep_E']})
+    data['mllll'] = (p4[:, 0] + p4[:, 1] + p4[:, 2] + p4[:, 3]).mass * 0.001
+    payloads = {'json': json.dumps(ak.to_list(data)).encode()}
+    try:
+        import stream
+        import wire
+        payloads['arrow'] = stream.encode(data)
+        payloads['wire'] = wire.encode_events(data, {})
+    except ImportError:
+        pass  # Only JSON where stream.py and wire.py aren't deployed, as in Docker Working Directory 3
+    return len(data), payloads
+
+
+def benchmark(path, entry_stop=None, repeats=3):
+    """Print the compression ratio and MB/s of every available codec and level on each payload."""
+    n_events, payloads = _payloads(path, entry_stop)
+    print(f"{n_events} selected events of {path}")
+    for payload, body in payloads.items():
+        print(f"{payload}: {len(body) / 1e6:.2f} MB")
+        for name in available():
+            for codec_level in CODECS[name][2]:
+                times = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    compressed, encoding = compress(body, name, codec_level)
+                    middle = time.perf_counter()
+                    decompressed = decompress(compressed, pika.BasicProperties(content_encoding=encoding))
+                    times.append((middle - start, time.perf_counter() - middle))
+                assert decompressed == body
+                compress_time, decompress_time = (min(column) for column in zip(*times))
+                print(f"\t{name:<5} level {codec_level:<3} ratio {len(body) / len(compressed):6.2f}  "
+                      f"compress {len(body) / compress_time / 1e6:8.1f} MB/s  "
+                      f"decompress {len(body) / decompress_time / 1e6:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    # python codec.py [ROOT file [entries]] benchmarks on the selected events of a 4lep file
+    from config import tuple_path
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else tuple_path + "MC/mc_361106.Zee.4lep.root",
+              int(sys.argv[2]) if len(sys.argv) > 2 else None)
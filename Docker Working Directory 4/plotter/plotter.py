@@ -2,138 +2,537 @@
 """
 Created on Tue Apr 23 10:42:08 2024
 @author: Mohammad
+
+Consumes on an asyncio event loop. Results are deserialized and filled into
+histograms on a thread pool and merged back on the loop in the order their queue
+delivered them, while plots are drawn on a render thread of their own, so
+ingestion never waits for a PNG to render.
 """
 import os
+import sys
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are drawn off the main thread
 import matplotlib.pyplot as plt
-from matplotlib.ticker import AutoMinorLocator
 import pika
-import pickle  # Replace json with pickle
-import awkward as ak
-from time import sleep
+from pika.adapters.asyncio_connection import AsyncioConnection
+import json
+import histograms
+import codec
+import metrics
+import stream
+import wire
+from config import result_queues, run_id, results_exchange, runs_queue, queue_arguments, run_queue
+from config import lumi_periods
 
 output_dir = '/app/output'
 # Constants for unit conversion
 GeV = 1.0
 MeV = 0.001
 
-def connect_to_rabbitmq():
-    """Establish a connection to RabbitMQ server with retry logic."""
+# Histograms received so far of each run, merged per sample group
+run_histograms = {}
+
+# Sequence numbers received so far of each event stream that hasn't ended yet
+open_streams = {}
+
+# Number of batches of each open stream whose end-of-stream marker has arrived
+stream_batches = {}
+
+# Streams that have ended, so batches sent again after their end-of-stream marker are dropped
+closed_streams = set()
+
+# Result queues to fan in, and the sample groups they carry; the plot is drawn once all of them are complete
+plot_queues = os.getenv('HZZ_PLOT_QUEUES', ','.join(result_queues.values())).split(',')
+plot_groups = [group for group, queue in result_queues.items() if queue in plot_queues]
+
+# Per (run, group): the parts (shards, or tasks in work queue mode) whose results have been received in full,
+# and the completion messages their producers sent, by part index
+received_parts = {}
+completions = {}
+rendered_runs = set()
+
+# Per (run, group): the parts whose producer gave up on them, so the run is plotted without them
+failed_parts = {}
+
+# Channel and consumer tags of the queues of every run being plotted
+run_consumers = {}
+
+# Binning of the plot, derived at render time from the master histograms (see histograms.py)
+plot_binning = (float(os.getenv('HZZ_PLOT_XMIN', str(histograms.xmin))),
+                float(os.getenv('HZZ_PLOT_XMAX', str(histograms.xmax))),
+                float(os.getenv('HZZ_PLOT_STEP', str(histograms.step_size))))
+histograms.plot_edges(*plot_binning)  # Stop at startup on a binning that isn't whole master bins
+
+# Data periods to plot; simulation is scaled to their summed luminosity
+plot_periods = os.getenv('HZZ_PERIODS', ','.join(lumi_periods)).split(',')
+
+# Decay channels to plot (see histograms.CHANNELS), and how the plot names them
+plot_channels = os.getenv('HZZ_CHANNELS', ','.join(histograms.CHANNELS.values())).split(',')
+channel_labels = {'4e': '$4e$', '2e2mu': r'$2e2\mu$', '4mu': r'$4\mu$'}
+
+# Luminosity in fb^-1 that producers older than per-period plotting normalised simulated weights to
+legacy_lumi = 10
+
+# Unacknowledged messages RabbitMQ may hand the plotter at once
+prefetch_count = int(os.getenv('HZZ_PREFETCH', '10'))
+
+# Threads deserializing and filling results, and whether a run's plot is redrawn as its results arrive
+decode_threads = int(os.getenv('HZZ_DECODE_THREADS', str(os.cpu_count() or 1)))
+live_render = os.getenv('HZZ_LIVE_RENDER', '1') == '1'
+
+# Last result handled from each consumer, so results are merged in the order their queue delivered them
+lanes = {}
+
+class Renderer:
+    """Thread drawing plots one at a time; of the updates to a plot that queue up, only the latest is drawn."""
+
+    def __init__(self):
+        self.pending = {}  # plot -> (function, args) of its latest update
+        self.condition = threading.Condition()
+        self.coalesced = 0
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, key, function, *args):
+        """Queue a render of a plot, replacing any update of the same plot that hasn't started yet."""
+        with self.condition:
+            if key in self.pending:
+                self.coalesced += 1
+            self.pending[key] = (function, args)
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                key = next(iter(self.pending))
+                function, args = self.pending.pop(key)
+            try:
+                with metrics.stage('render', key):
+                    function(*args)
+            except Exception as e:
+                print(f"Failed to render {key}: {e}")
+
+pool = ThreadPoolExecutor(max_workers=decode_threads)
+renderer = Renderer()
+
+def connection_parameters():
+    """Broker address and credentials from the environment."""
     credentials = pika.PlainCredentials(os.getenv('RABBITMQ_DEFAULT_USER', 'user'),
                                         os.getenv('RABBITMQ_DEFAULT_PASS', 'password'))
-    host = os.getenv('RABBITMQ_HOST', 'rabbitmq')
-    port = int(os.getenv('RABBITMQ_PORT', '5672'))
+    return pika.ConnectionParameters(host=os.getenv('RABBITMQ_HOST', 'rabbitmq'),
+                                     port=int(os.getenv('RABBITMQ_PORT', '5672')), virtual_host='/',
+                                     credentials=credentials, connection_attempts=3, retry_delay=5,
+                                     socket_timeout=5)
 
+async def connect_to_rabbitmq():
+    """Open an asyncio connection to RabbitMQ with retry logic, and return it with a future set when it closes."""
+    loop = asyncio.get_running_loop()
     for _ in range(5):  # Retry up to 5 times
+        opened, closed = loop.create_future(), loop.create_future()
+        AsyncioConnection(
+            connection_parameters(), custom_ioloop=loop,
+            on_open_callback=opened.set_result,
+            on_open_error_callback=lambda _, error, opened=opened: opened.set_exception(
+                pika.exceptions.AMQPConnectionError(error)),
+            on_close_callback=lambda _, reason, closed=closed: closed.done() or closed.set_result(reason))
         try:
-            parameters = pika.ConnectionParameters(host=host, port=port, virtual_host='/',
-                                                   credentials=credentials, connection_attempts=3,
-                                                   retry_delay=5, socket_timeout=5)
-            return pika.BlockingConnection(parameters)
-        except pika.exceptions.AMQPConnectionError as e:
+            return await opened, closed
+        except pika.exceptions.AMQPConnectionError:
             print("Failed to connect to RabbitMQ, retrying...")
-            sleep(5)
+            await asyncio.sleep(5)
     raise Exception("Failed to connect to RabbitMQ after multiple attempts.")
 
-def check_all_containers_finished():
-    """Check if all containers have finished processing."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue='completion_queue', durable=True)
-    
-    def completion_callback(ch, method, properties, body):
-        nonlocal count
-        count += 1
-        print(f"Received completion message {count}/4")
-        if count >= 4:  # Adjusted to match the number of processing containers
-            channel.stop_consuming()
-
-    count = 0
-    channel.basic_consume(queue='completion_queue', on_message_callback=completion_callback, auto_ack=True)
-    print('Waiting for all processing containers to complete...')
-    channel.start_consuming()
-    connection.close()
-    print('All processing containers have completed. Proceeding to consume plot data.')
-
-def start_consuming():
-    """Start consuming messages from RabbitMQ to plot."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue='plotting_queue', durable=True)
-    channel.basic_consume(queue='plotting_queue', on_message_callback=plot_callback, auto_ack=True)
-    print('Waiting for plot data messages. To exit press CTRL+C')
-    channel.start_consuming()
-
-def plot_callback(ch, method, properties, body):
-    """Callback function to process received messages and plot data."""
+def call(method, **kwargs):
+    """Future of an asynchronous pika method that reports its reply through a callback."""
+    future = asyncio.get_running_loop().create_future()
+    method(callback=lambda reply: future.done() or future.set_result(reply), **kwargs)
+    return future
+
+def completion_callback(ch, method, properties, body):
+    """Record a producer's completion message, and plot its run once every group is complete."""
+    try:
+        completion = json.loads(body)
+        run, group = completion['run_id'], completion['group']
+        index, count = part_of(completion)
+        events = completion['events']
+    except (ValueError, KeyError, TypeError):
+        print(f"Rejecting completion message without a run id, group or event count: {body!r}")
+        ch.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
+        return
+    completions.setdefault((run, group), {})[index] = completion
+    if 'error' in completion:
+        # No results will come for a failed part, so it counts as received
+        failed_parts.setdefault((run, group), set()).add(index)
+        received_parts.setdefault((run, group), set()).add(index)
+        print(f"Run {run}: part {index + 1}/{count} of {group} failed: {completion['error']}")
+    else:
+        print(f"Run {run}: part {index + 1}/{count} of {group} completed with {events} events")
+    check_run(run)
+    ch.basic_ack(delivery_tag=method.delivery_tag)
+
+async def start_consuming():
+    """Consume the announcements of runs until the connection closes."""
+    connection, closed = await connect_to_rabbitmq()
+    opened = asyncio.get_running_loop().create_future()
+    connection.channel(on_open_callback=opened.set_result)
+    channel = await opened
+    await call(channel.basic_qos, prefetch_count=prefetch_count)  # Bounds the batches held in memory
+    await call(channel.exchange_declare, exchange=results_exchange, exchange_type='topic', durable=True)
+    await declare_queue(channel, runs_queue)
+    channel.basic_consume(queue=runs_queue, on_message_callback=run_callback)
+    print('Waiting for runs to be announced. To exit press CTRL+C')
+    print(f"Connection closed: {await closed}")
+
+async def declare_queue(channel, queue_name):
+    """Declare a queue the same way the publishers do, bound to the results exchange under its own name."""
+    await call(channel.queue_declare, queue=queue_name, durable=True, arguments=queue_arguments)
+    await call(channel.queue_bind, queue=queue_name, exchange=results_exchange, routing_key=queue_name)
+
+def run_callback(ch, method, properties, body):
+    """Start consuming the queues of a newly announced run."""
     try:
-        data = pickle.loads(body)  # Use pickle to deserialize data
-        print("Plotting data...")
-        plot_data(data)
-        ch.basic_ack(delivery_tag=method.delivery_tag)  # Manually send the acknowledgment
-        print(f"Data plotted and acknowledged for delivery tag: {method.delivery_tag}")
+        run = json.loads(body)['run_id']
+    except (ValueError, KeyError, TypeError):
+        print(f"Rejecting run announcement without a run id: {body!r}")
+        ch.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
+        return
+    if run in rendered_runs:
+        print(f"Run {run} was announced again after it was plotted, ignoring it; give every run its own HZZ_RUN_ID")
+    elif run not in run_consumers:
+        run_consumers[run] = (ch, [])
+        asyncio.ensure_future(consume_run(ch, run))
+    ch.basic_ack(delivery_tag=method.delivery_tag)
+
+async def consume_run(ch, run):
+    """Consume every result queue of a run, and its completion queue."""
+    # Every result queue of the run is consumed at once, so groups are merged in whatever order they finish
+    _, tags = run_consumers[run]
+    for queue_name in plot_queues:
+        await declare_queue(ch, run_queue(run, queue_name))
+        tags.append(ch.basic_consume(queue=run_queue(run, queue_name), on_message_callback=result_callback))
+    await declare_queue(ch, run_queue(run, 'completion_queue'))
+    tags.append(ch.basic_consume(queue=run_queue(run, 'completion_queue'), on_message_callback=completion_callback))
+    print(f"Consuming results of run {run}")
+
+def result_callback(ch, method, properties, body):
+    """Hand a result to the thread pool, to be merged after the results its queue delivered before it."""
+    previous = lanes.get(method.consumer_tag)
+    lanes[method.consumer_tag] = asyncio.ensure_future(handle_result(previous, ch, method, properties, body))
+
+async def handle_result(previous, ch, method, properties, body):
+    """Decode a result on the thread pool, then merge it into the histograms of its run and sample group."""
+    decoding = asyncio.get_running_loop().run_in_executor(pool, decode_result, method.routing_key, properties, body)
+    if previous is not None:
+        await asyncio.wait([previous])
+    try:
+        merge_result(properties, body, await decoding)
+        ch.basic_ack(delivery_tag=method.delivery_tag)
     except Exception as e:
-        print(f"Failed to plot data: {e}")
-        ch.basic_nack(delivery_tag=method.delivery_tag)
+        print(f"Failed to merge result from {method.routing_key}: {e}")
+        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+
+def decode_result(queue_name, properties, body):
+    """Histogram message of a result, None for an end-of-stream marker. Runs on the thread pool."""
+    headers = properties.headers or {}
+    if not stream.is_stream(properties):
+        with metrics.stage('consume', queue_name) as record:
+            message = load_histograms(properties, body)
+            record['bytes'] = len(body)
+        return per_unit_lumi(message, headers.get('weight_lumi', legacy_lumi))
+    if headers['eos'] or part_received(headers.get('run_id', run_id), headers['group'], headers) or \
+            batch_folded(headers):
+        return None
+    with metrics.stage('consume', headers['sample'], headers['seq']) as record:
+        frame = stream.read(properties, body)
+        record['events_out'], record['bytes'] = len(frame), len(body)
+    message = histograms.fill_group(headers['group'], [frame], [headers['sample']], headers.get('color'))
+    return per_unit_lumi(message, headers.get('weight_lumi', legacy_lumi))
+
+def batch_folded(headers):
+    """Return True if a batch was already folded in, so its claim-check blob may be gone. Runs on the thread pool."""
+    # The batch's own set is looked at before the closed streams, which a stream joins as its set is dropped
+    return headers['seq'] in open_streams.get(headers['stream'], ()) or headers['stream'] in closed_streams
+
+def per_unit_lumi(message, lumi):
+    """Histogram message of a simulated group normalised to 1 fb^-1 from lumi fb^-1; data is left as it is."""
+    return message if message['group'] == 'data' or lumi == 1 else histograms.scale_group(message, 1 / lumi)
+
+def select_periods(group_hists, periods, channels=None):
+    """Histograms of the data taken in periods, with simulation scaled to their luminosity, and that luminosity.
+    Only the events of the given decay channels are counted, all of them by default."""
+    if 'data' in group_hists and not group_hists['data']['samples'] and set(periods) != set(lumi_periods):
+        print("Data was saved without its periods, plotting all of them")
+        periods = list(lumi_periods)
+    if channels is not None and not set(channels) >= set(histograms.CHANNELS.values()) and \
+            not all('channels' in message for message in group_hists.values()):
+        print("Histograms were filled without their decay channels, plotting all of them")
+        channels = None
+    lumi = sum(lumi_periods[period] for period in periods)
+    selected = {}
+    for group, message in group_hists.items():
+        if group != 'data':
+            total = histograms.scale(histograms.select(message, channels=channels), lumi)
+        elif message['samples']:
+            total = histograms.select(message, periods, channels)
+        else:
+            total = message['total']
+        selected[group] = dict(message, total=total)
+    return selected, lumi
+
+def merge_result(properties, body, message):
+    """Merge a decoded result into its run, and plot the run once every group is complete. Runs on the event loop."""
+    headers = properties.headers or {}
+    run = headers.get('run_id', run_id)
+    if stream.is_stream(properties):
+        group, done = headers['group'], fold_batch(run, properties, body, message)
+    else:
+        group, done = message['group'], True
+        if not part_received(run, group, headers):
+            add_histograms(run, message)  # Unless it was sent again after a missed confirm
+    if done:
+        received_parts.setdefault((run, group), set()).add(part_of(headers)[0])
+        check_run(run)
+    if live_render and run not in rendered_runs and run_histograms.get(run):
+        renderer.submit(run, plot_histograms, dict(run_histograms[run]), plot_filename(run))
+
+def load_histograms(properties, body):
+    """Histogram message of a result in the wire format; anything else, e.g. a pickle, is rejected."""
+    if properties.content_type != wire.CONTENT_TYPE:
+        raise ValueError(f"Not a wire format result: {properties.content_type}")
+    return wire.decode_histograms(codec.decompress(body, properties))
+
+def part_of(headers):
+    """(index, count) of the part of its group a message belongs to: its task in work queue mode, else its shard."""
+    if 'task_count' in headers:
+        return headers['task_index'], headers['task_count']
+    return headers.get('shard_index', 0), headers.get('shard_count', 1)
+
+def part_received(run, group, headers):
+    """Return True if the results of the part of its group a message belongs to are already in."""
+    return part_of(headers)[0] in received_parts.get((run, group), ())
 
-def plot_data(data):
-    """Plot data using the same style and annotations as the original script."""
-    xmin = 80 * GeV
-    xmax = 250 * GeV
-    step_size = 5 * GeV
+def group_complete(run, group):
+    """Return True once every part of a group has reported completion and its results have been received."""
+    done = completions.get((run, group))
+    if not done:
+        return False
+    count = part_of(next(iter(done.values())))[1]
+    return len(done) == count and set(done) <= received_parts.get((run, group), set())
 
-    bin_edges = np.arange(start=xmin, stop=xmax+step_size, step=step_size)
-    bin_centres = np.arange(start=xmin+step_size/2, stop=xmax+step_size/2, step=step_size)
+def check_run(run):
+    """Plot a run the moment the last part of the last group it waits for is in."""
+    if run in rendered_runs or not all(group_complete(run, group) for group in plot_groups):
+        return
+    rendered_runs.add(run)
+    events = sum(completion['events'] for group in plot_groups for completion in completions[(run, group)].values())
+    print(f"Run {run} complete with {events} selected events, plotting...")
+    failed = sum(len(failed_parts.get((run, group), ())) for group in plot_groups)
+    if failed:
+        print(f"Run {run} is missing the results of {failed} failed parts")
+    group_hists = run_histograms.get(run, {})
+    if group_hists:
+        renderer.submit(run, render_run, run, dict(group_hists))
+    else:
+        print(f"Run {run} has no results to plot, every part failed")
+    # Left without consumers, the run's queues expire on the broker
+    channel, tags = run_consumers.pop(run, (None, ()))
+    for tag in tags:
+        channel.basic_cancel(tag)
+        lanes.pop(tag, None)
 
-    data_x, _ = np.histogram(ak.to_numpy(data['data']['mllll']), bins=bin_edges)
+def plot_filename(run):
+    """File name of the plot of a run."""
+    return f'histogram_plot_{run}.png'
+
+def histograms_filename(run):
+    """File name of the master histograms of a run."""
+    return f'histograms_{run}.npz'
+
+def render_run(run, group_hists):
+    """Save the master histograms of a complete run, then plot it."""
+    save_histograms(group_hists, os.path.join(output_dir, histograms_filename(run)))
+    plot_histograms(group_hists, plot_filename(run))
+
+def save_histograms(group_hists, path):
+    """Write the master histograms of each sample group and its samples to an .npz file, to plot again with any
+    binning, data periods and decay channels."""
+    groups = list(group_hists)
+    arrays = {'bin_edges': histograms.BIN_EDGES, 'groups': np.array(groups),
+              'colors': np.array([group_hists[group]['color'] or '' for group in groups]), 'weight_lumi': 1}
+    for index, group in enumerate(groups):
+        arrays[f'{index}.sumw'] = group_hists[group]['total']['sumw']
+        arrays[f'{index}.sumw2'] = group_hists[group]['total']['sumw2']
+        samples = list(group_hists[group]['samples'])
+        arrays[f'{index}.samples'] = np.array(samples)
+        for sample_index, sample in enumerate(samples):
+            arrays[f'{index}.{sample_index}.sumw'] = group_hists[group]['samples'][sample]['sumw']
+            arrays[f'{index}.{sample_index}.sumw2'] = group_hists[group]['samples'][sample]['sumw2']
+            for channel, hist in group_hists[group].get('channels', {}).get(sample, {}).items():
+                arrays[f'{index}.{sample_index}.{channel}.sumw'] = hist['sumw']
+                arrays[f'{index}.{sample_index}.{channel}.sumw2'] = hist['sumw2']
+    np.savez(path, **arrays)
+    print(f"Histograms saved to {path}")
+
+def read_histograms(path):
+    """Master histograms of each sample group saved by save_histograms, simulation normalised to 1 fb^-1."""
+    with np.load(path) as arrays:
+        def histogram(prefix):
+            return {'bin_edges': arrays['bin_edges'], 'sumw': arrays[f'{prefix}.sumw'],
+                    'sumw2': arrays[f'{prefix}.sumw2']}
+
+        lumi = float(arrays['weight_lumi']) if 'weight_lumi' in arrays else legacy_lumi
+        group_hists = {}
+        for index, (group, color) in enumerate(zip(arrays['groups'], arrays['colors'])):
+            samples = arrays[f'{index}.samples'] if f'{index}.samples' in arrays else []  # Older files have none
+            message = {'group': str(group), 'color': str(color) or None, 'total': histogram(index),
+                       'samples': {str(sample): histogram(f'{index}.{sample_index}')
+                                   for sample_index, sample in enumerate(samples)}}
+            if len(samples) and all(f'{index}.0.{channel}.sumw' in arrays for channel in histograms.CHANNELS.values()):
+                message['channels'] = {str(sample): {channel: histogram(f'{index}.{sample_index}.{channel}')
+                                                     for channel in histograms.CHANNELS.values()}
+                                       for sample_index, sample in enumerate(samples)}
+            group_hists[str(group)] = per_unit_lumi(message, lumi)
+        return group_hists
+
+def add_histograms(run, message):
+    """Add the histograms of a processor's message to the totals of its run and sample group, bin by bin."""
+    group_histograms = run_histograms.setdefault(run, {})
+    group = message['group']
+    if group in group_histograms:
+        group_histograms[group] = histograms.add_group(group_histograms[group], message)
+    else:
+        group_histograms[group] = message
+
+def fold_batch(run, properties, body, message):
+    """Fold the histograms of one batch of an event stream into its group, and return True once every batch
+    the end-of-stream marker counts has been folded in."""
+    headers = properties.headers
+    stream_id = headers['stream']
+    if part_received(run, headers['group'], headers):
+        stream.release(properties, body)
+        return False  # A part sent again, e.g. by a retried task, after its results were folded in
+    if stream_id in closed_streams:
+        stream.release(properties, body)
+        return False
+    seen = open_streams.setdefault(stream_id, set())
+    if headers['eos']:
+        stream_batches[stream_id] = headers['batches']
+        if len(seen) < headers['batches']:
+            print(f"Stream {stream_id} of {headers['group']} ended with {len(seen)}/{headers['batches']} "
+                  f"batches in, waiting for the rest")
+    elif headers['seq'] in seen:
+        stream.release(properties, body)
+        return False  # Sent again by a publisher that didn't get the broker's confirm
+    else:
+        add_histograms(run, message)
+        seen.add(headers['seq'])
+        stream.release(properties, body)
+    if len(seen) != stream_batches.get(stream_id):
+        return False
+    closed_streams.add(stream_id)
+    del open_streams[stream_id], stream_batches[stream_id]
+    return True
+
+def stack_bars(axes, bin_edges, heights, colors, labels, bottom=None):
+    """Draw histogram contents stacked as bars, without histogramming again; returns the top of the stack."""
+    top = np.zeros(len(bin_edges) - 1) if bottom is None else np.asarray(bottom, dtype=float)
+    for height, color, label in zip(heights, colors, labels):
+        axes.bar(bin_edges[:-1], height, width=np.diff(bin_edges), bottom=top, align='edge',
+                 color=color, label=label)
+        top = top + height
+    return top
+
+def plot_histograms(group_hists, filename='histogram_plot.png', bin_edges=None, periods=None, channels=None):
+    """Plot pre-filled histograms in the style of the original analysis, rebinned to bin_edges (default plot_binning),
+    for the data of periods (default plot_periods) and simulation scaled to their luminosity, in the decay
+    channels given (default plot_channels)."""
+    bin_edges = histograms.plot_edges(*plot_binning) if bin_edges is None else bin_edges
+    channels = plot_channels if channels is None else channels
+    group_hists, lumi = select_periods(group_hists, plot_periods if periods is None else periods, channels)
+    step_size = bin_edges[1] - bin_edges[0]
+    bin_centres = (bin_edges[:-1] + bin_edges[1:]) / 2
+    zeros = histograms.empty(bin_edges)
+    group_hists = {group: dict(message, total=histograms.rebin(message['total'], bin_edges))
+                   for group, message in group_hists.items()}
+
+    data_x = group_hists['data']['total']['sumw'] if 'data' in group_hists else zeros['sumw']
     data_x_errors = np.sqrt(data_x)
 
-    signal_x = ak.to_numpy(data['Signal']['mllll'])
-    signal_weights = ak.to_numpy(data['Signal']['totalWeight'])
+    signal = zeros
     signal_color = "#00cdff"  # Light blue for signal
-
-    mc_x = []
-    mc_weights = []
+    mc_sumw = []
+    mc_sumw2 = []
     mc_colors = []
     mc_labels = []
-
-    for key, value in data['background'].items():
-        mc_x.append(ak.to_numpy(value['mllll']))
-        mc_weights.append(ak.to_numpy(value['totalWeight']))
-        mc_colors.append(value['color'])
-        mc_labels.append(key)
+    for group, message in group_hists.items():
+        if group == 'data':
+            continue
+        if group.startswith('Signal'):
+            signal = message['total']
+            signal_color = message['color'] or signal_color
+            continue
+        mc_sumw.append(message['total']['sumw'])
+        mc_sumw2.append(message['total']['sumw2'])
+        mc_colors.append(message['color'])
+        mc_labels.append(group)
 
     plt.figure(figsize=(10, 7))
     main_axes = plt.gca()
 
     main_axes.errorbar(x=bin_centres, y=data_x, yerr=data_x_errors, fmt='ko', label='Data')
-    mc_heights = main_axes.hist(mc_x, bins=bin_edges, weights=mc_weights, stacked=True, color=mc_colors, label=mc_labels)
-    mc_x_tot = mc_heights[0][-1]
+    mc_x_tot = stack_bars(main_axes, bin_edges, mc_sumw, mc_colors, mc_labels)
 
-    mc_x_err = np.sqrt(np.histogram(np.hstack(mc_x), bins=bin_edges, weights=np.hstack(mc_weights)**2)[0])
-    main_axes.hist(signal_x, bins=bin_edges, bottom=mc_x_tot, weights=signal_weights, color=signal_color, label='Signal ($m_H$ = 125 GeV)')
+    mc_x_err = np.sqrt(np.sum(mc_sumw2, axis=0)) if mc_sumw2 else np.zeros(len(bin_centres))
+    stack_bars(main_axes, bin_edges, [signal['sumw']], [signal_color], ['Signal ($m_H$ = 125 GeV)'], bottom=mc_x_tot)
 
     main_axes.bar(bin_centres, 2 * mc_x_err, alpha=0.5, bottom=mc_x_tot - mc_x_err, color='none', hatch="////", width=step_size, label='Stat. Unc.')
 
-    main_axes.set_xlim(left=xmin, right=xmax)
+    main_axes.set_xlim(left=bin_edges[0], right=bin_edges[-1])
     main_axes.set_xlabel(r'4-lepton invariant mass $\mathrm{m_{4l}}$ [GeV]', fontsize=13)
-    main_axes.set_ylabel('Events / ' + str(step_size) + ' GeV', fontsize=13)
+    main_axes.set_ylabel(f'Events / {step_size:g} GeV', fontsize=13)
 
     plt.text(0.05, 0.93, 'ATLAS Open Data', transform=main_axes.transAxes, fontsize=13)
     plt.text(0.05, 0.88, 'for education', transform=main_axes.transAxes, style='italic', fontsize=8)
-    plt.text(0.05, 0.82, '$\sqrt{s}$=13 TeV,$\int$L dt = 10 fb$^{-1}$', transform=main_axes.transAxes)
+    plt.text(0.05, 0.82, r'$\sqrt{s}$=13 TeV,$\int$L dt = ' + f'{lumi:g}' + r' fb$^{-1}$', transform=main_axes.transAxes)
     plt.text(0.05, 0.76, r'$H \rightarrow ZZ^* \rightarrow 4\ell$', transform=main_axes.transAxes)
+    if not set(channels) >= set(histograms.CHANNELS.values()):
+        plt.text(0.05, 0.70, ', '.join(channel_labels.get(channel, channel) for channel in channels),
+                 transform=main_axes.transAxes)
 
     main_axes.legend(frameon=False)
-    plot_filename = 'histogram_plot.png'
-   
-    # Construct the full path where the plot will be saved
-    plot_path = os.path.join(output_dir, plot_filename)
-
-    # Save the plot to the specified directory
-    plt.savefig(plot_path)
-    
+    plot_path = os.path.join(output_dir, filename)
+    temp_path = plot_path + '.tmp'
+    plt.savefig(temp_path, format='png')
+    plt.close()
+    os.replace(temp_path, plot_path)  # Live updates never leave a half-written plot behind
     print(f"Plot saved to {plot_path}")
 
 if __name__ == "__main__":
-    start_consuming()
+    if sys.argv[1:2] == ['replot']:
+        # python plotter.py replot histograms.npz [xmin xmax step [periods [channels]]] plots saved histograms with
+        # another binning, for comma-separated subsets of the data periods and decay channels (default HZZ_PERIODS
+        # and HZZ_CHANNELS)
+        path, binning = sys.argv[2], [float(value) for value in sys.argv[3:6]] or plot_binning
+        periods = sys.argv[6].split(',') if len(sys.argv) > 6 else plot_periods
+        channels = sys.argv[7].split(',') if len(sys.argv) > 7 else plot_channels
+        output_dir = os.path.dirname(os.path.abspath(path))
+        name = os.path.splitext(os.path.basename(path))[0].replace('histograms', 'histogram_plot')
+        if set(periods) != set(lumi_periods):
+            name += '_' + '+'.join(period.replace('data_', '') for period in periods)
+        if set(channels) != set(histograms.CHANNELS.values()):
+            name += '_' + '+'.join(channels)
+        group_hists = read_histograms(path)
+        start = time.perf_counter()
+        _, lumi = select_periods(group_hists, periods, channels)
+        print(f"Selected {lumi:g} fb^-1 of data in {(time.perf_counter() - start) * 1000:.1f} ms")
+        plot_histograms(group_hists, f"{name}_{binning[0]:g}-{binning[1]:g}_{binning[2]:g}GeV.png",
+                        histograms.plot_edges(*binning), periods, channels)
+    else:
+        metrics.serve()
+        asyncio.run(start_consuming())
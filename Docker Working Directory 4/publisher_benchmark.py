@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of publisher.Publisher with confirms off, per message and windowed.
+
+Runs against an in-process stand-in for the broker connection, or against the
+broker at RABBITMQ_HOST. The stand-in is also what the tests publish to. It
+lives here rather than in publisher.py so it isn't copied into the services.
+"""
+
+import os
+import sys
+import time
+
+import pika
+
+from publisher import Publisher, connection_parameters
+
+
+class StandInBroker:
+    """In-process stand-in for a broker connection that confirms each message after a round trip."""
+
+    def __init__(self, parameters=None, round_trip=0.0005, per_message=0.00002):
+        self.round_trip = round_trip  # Network round trip plus the broker's fsync of persistent messages
+        self.per_message = per_message  # Broker time per message
+        self.is_open = True
+        self.pending = []  # (time the ack arrives, delivery tag)
+        self.ack_callback = None
+        self.next_tag = 1
+        self._impl = self
+        self.last_free = time.perf_counter()
+
+    def channel(self):
+        return self
+
+    def queue_declare(self, queue, durable=True, arguments=None):
+        pass
+
+    def confirm_delivery(self, ack_nack_callback=None, callback=None):
+        self.ack_callback = ack_nack_callback
+        if callback:
+            callback(None)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        # The broker works through messages one at a time, the ack then takes half a round trip back
+        self.last_free = max(self.last_free, time.perf_counter() + self.round_trip / 2) + self.per_message
+        if self.ack_callback is None:
+            return
+        self.pending.append((self.last_free + self.round_trip / 2, self.next_tag))
+        self.next_tag += 1
+
+    def process_data_events(self, time_limit=0):
+        deadline = time.perf_counter() + (time_limit or 0)
+        while True:
+            now = time.perf_counter()
+            due = [tag for arrives, tag in self.pending if arrives <= now]
+            if due:
+                self.pending = [(arrives, tag) for arrives, tag in self.pending if arrives > now]
+                # One ack covers every message up to the newest due one, as RabbitMQ batches them
+                method = pika.spec.Basic.Ack(delivery_tag=max(due), multiple=True)
+                self.ack_callback(pika.frame.Method(1, method))
+                return
+            if now >= deadline:
+                return
+            wait = min([arrives for arrives, _ in self.pending] + [deadline]) - now
+            time.sleep(max(wait, 0))
+
+    def close(self):
+        self.is_open = False
+
+
+def benchmark(n_messages=5000, size=64 * 1024, windows=(0, 1, 16, 256), parameters=None):
+    """Messages per second with confirms off (window 0), per message (window 1) and windowed."""
+    body = os.urandom(size)
+    for window in windows:
+        if parameters is None:
+            publisher = Publisher(confirm_window=window, connection_class=StandInBroker)
+        else:
+            publisher = Publisher(parameters, confirm_window=window)
+        start = time.perf_counter()
+        for _ in range(n_messages):
+            publisher.publish('confirm_benchmark', body, pika.BasicProperties(delivery_mode=2))
+        publisher.close()
+        elapsed = time.perf_counter() - start
+        mode = 'off' if window == 0 else f"window {window}"
+        print(f"confirms {mode:<11} {n_messages / elapsed:10.0f} msg/s  {publisher.stats()}")
+
+
+if __name__ == "__main__":
+    # python publisher_benchmark.py runs against the stand-in, python publisher_benchmark.py broker against RABBITMQ_HOST
+    benchmark(parameters=connection_parameters() if 'broker' in sys.argv[1:] else None)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Read-through on-disk cache for the remote 4lep ROOT files.
+
+Files are keyed by URL plus the remote size/ETag, so a re-published file gets a
+new entry; local paths and file:// URLs are read in place. Downloads resume from the partial file left by an interrupted run,
+and the least recently used entries are evicted once the cache grows past its
+byte budget.
+"""
+
+import os
+import time
+import fcntl
+import hashlib
+import urllib.parse
+import urllib.request
+from contextlib import contextmanager
+
+import uproot
+
+from config import cache_dir, cache_max_bytes
+
+CHUNK_SIZE = 1024 * 1024  # Bytes copied per read while downloading
+
+
+EVICT_LOCK = 'evict.lock'  # Held shared while files are fetched and opened, exclusive while evicting
+
+# Cache key of each URL this process has already fetched, so cache hits don't ask the server again
+_keys = {}
+
+
+def is_remote(url):
+    """Return True for URLs that should go through the cache."""
+    return urllib.parse.urlparse(url).scheme in ('http', 'https')
+
+
+def local_path(url):
+    """Path of a local file given as a path or a file:// URL, which are read in place."""
+    parsed = urllib.parse.urlparse(url)
+    return urllib.request.url2pathname(parsed.path) if parsed.scheme == 'file' else url
+
+
+def remote_metadata(url):
+    """Return the (size, etag) of a remote file."""
+    request = urllib.request.Request(url, method='HEAD')
+    with urllib.request.urlopen(request) as response:
+        size = int(response.headers.get('Content-Length', -1))
+        etag = response.headers.get('ETag', '').strip('"')
+    return size, etag
+
+
+def cache_key(url, size, etag):
+    """Content address of a remote file."""
+    return hashlib.sha256(f"{url}|{size}|{etag}".encode()).hexdigest()
+
+
+@contextmanager
+def _locked(path, operation=fcntl.LOCK_EX):
+    """Hold a lock on path, exclusive by default, so concurrent workers don't download the same file twice."""
+    with open(path, 'a') as lock:
+        fcntl.flock(lock, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _download(url, part_path, size):
+    """Download url into part_path, resuming from whatever is already there."""
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if size >= 0 and offset > size:
+        offset = 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header('Range', f"bytes={offset}-")
+    with urllib.request.urlopen(request) as response:
+        # Servers that ignore Range send the whole file again
+        resumed = offset and getattr(response, 'status', 200) == 206
+        with open(part_path, 'ab' if resumed else 'wb') as out:
+            while True:
+                block = response.read(CHUNK_SIZE)
+                if not block:
+                    break
+                out.write(block)
+    if size >= 0 and os.path.getsize(part_path) != size:
+        raise IOError(f"Incomplete download of {url}: "
+                      f"{os.path.getsize(part_path)} of {size} bytes")
+
+
+def evict(directory=None, max_bytes=None, keep=()):
+    """Delete least recently used cache entries, partial downloads included, until the cache fits its byte budget.
+
+    Runs only while no process is fetching or opening a file; otherwise it is left to the next fetch.
+    """
+    directory = directory or cache_dir
+    max_bytes = cache_max_bytes if max_bytes is None else max_bytes
+    with open(os.path.join(directory, EVICT_LOCK), 'a') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+        try:
+            entries = []
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name.endswith('.lock') and name != EVICT_LOCK:
+                    # No process holds a file lock while eviction runs, so they can all go
+                    _remove(path)
+                elif name.endswith(('.root', '.part')):
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= max_bytes:
+                    break
+                if path in keep:
+                    continue
+                _remove(path)
+                total -= size
+                print(f"\tEvicted {os.path.basename(path)} from cache")
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass  # Already gone
+
+
+def _cached_path(url, directory):
+    """Path of the cached copy of url, downloading it first if needed. Called with eviction held off."""
+    key, size = _keys.get(url), -1
+    if key is None or not os.path.exists(os.path.join(directory, key + '.root')):
+        size, etag = remote_metadata(url)
+        key = cache_key(url, size, etag)
+    path = os.path.join(directory, key + '.root')
+
+    with _locked(os.path.join(directory, key + '.lock')):
+        if not os.path.exists(path):
+            start = time.time()
+            part_path = os.path.join(directory, key + '.part')
+            _download(url, part_path, size)
+            os.replace(part_path, path)
+            print(f"\tCached {url} ({os.path.getsize(path)} bytes) in {round(time.time() - start, 1)}s")
+        os.utime(path)  # Mark as most recently used
+    _keys[url] = key
+    return path
+
+
+def fetch(url, directory=None, max_bytes=None):
+    """Return a local path for url, downloading it into the cache if needed.
+
+    Another process may evict the file once this returns; open_tree keeps it until it is mapped.
+    """
+    if not is_remote(url):
+        return local_path(url)
+    directory = directory or cache_dir
+    os.makedirs(directory, exist_ok=True)
+    with _locked(os.path.join(directory, EVICT_LOCK), fcntl.LOCK_SH):
+        path = _cached_path(url, directory)
+    evict(directory, max_bytes, keep=(path,))
+    return path
+
+
+def open_tree(url, tree_name='mini', directory=None, max_bytes=None):
+    """Open a tree from the cached copy of url, or from the local file, using memory-mapped reads."""
+    if not is_remote(url):
+        return uproot.open(local_path(url) + ':' + tree_name, handler=uproot.MemmapSource)
+    directory = directory or cache_dir
+    os.makedirs(directory, exist_ok=True)
+    with _locked(os.path.join(directory, EVICT_LOCK), fcntl.LOCK_SH):
+        path = _cached_path(url, directory)
+        # Mapped before eviction can run again, so deleting the file later leaves the mapping intact
+        tree = uproot.open(path + ':' + tree_name, handler=uproot.MemmapSource)
+    evict(directory, max_bytes, keep=(path,))
+    return tree
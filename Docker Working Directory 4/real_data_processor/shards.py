@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Entry-range sharding across the replicas of a processor service.
+
+Every replica builds the same list of basket-cluster-aligned entry ranges over
+its sample group and keeps only its own contiguous slice, so adding replicas
+splits the work instead of repeating it.
+"""
+
+import uproot
+
+import filecache
+from config import shard_index, shard_count
+
+
+def shard_id(index=shard_index, count=shard_count):
+    """Label used to tag the outputs of a shard."""
+    return f"{index + 1}/{count}"
+
+
+def cluster_offsets(path):
+    """Entry offsets of the basket clusters shared by all branches of a file."""
+    # Read remotely with range requests, which fetch only the file's metadata; the cache then downloads
+    # only the files this shard goes on to process
+    with uproot.open(filecache.local_path(path) + ':mini') as tree:
+        return [int(offset) for offset in tree.common_entry_offsets()]
+
+
+def shard_ranges(paths, sample_names, index=shard_index, count=shard_count):
+    """(path, sample, entry_start, entry_stop) ranges this shard should process."""
+    if count <= 1:
+        return [(path, sample, 0, None) for path, sample in zip(paths, sample_names)]
+
+    clusters = []
+    for path, sample in zip(paths, sample_names):
+        offsets = cluster_offsets(path)
+        clusters += [(path, sample, start, stop) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    # Cut the sample group into count contiguous slices of about the same number of entries
+    total = sum(stop - start for _, _, start, stop in clusters)
+    lower, upper = total * index / count, total * (index + 1) / count
+    ranges = []
+    seen = 0
+    for path, sample, start, stop in clusters:
+        if lower <= seen < upper:
+            if ranges and ranges[-1][0] == path and ranges[-1][3] == start:
+                ranges[-1] = (path, sample, ranges[-1][2], stop)  # Merge neighbouring clusters
+            else:
+                ranges.append((path, sample, start, stop))
+        seen += stop - start
+
+    if not ranges:
+        # More shards than clusters, read an empty range so the output is still typed
+        ranges.append((paths[0], sample_names[0], 0, 0))
+    return ranges
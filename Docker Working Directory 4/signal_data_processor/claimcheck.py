@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Claim-check transport of result batches.
+
+Instead of sending a batch through RabbitMQ, the producer writes it as an Arrow
+IPC file to a blob store shared with the plotter and publishes only a reference
+to it: the blob's URL, size, SHA-256 checksum and schema. The plotter
+memory-maps the file, checks it against the reference and deletes it once the
+batch is folded in. Stores are picked by the scheme of their URL; file:// is a
+directory on a volume mounted by every service.
+"""
+
+import os
+import hashlib
+import urllib.parse
+
+import pyarrow as pa
+import awkward as ak
+
+CONTENT_TYPE = 'application/vnd.hzz.claim-check+json'
+
+
+class LocalStore:
+    """Blob store in a directory on a volume shared by producers and consumers."""
+
+    def __init__(self, root):
+        self.root = root
+
+    @staticmethod
+    def path(url):
+        return urllib.parse.unquote(urllib.parse.urlparse(url).path)
+
+    def put(self, key, data):
+        """Write data as the blob key and return its URL."""
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as out:
+            out.write(data)
+        os.replace(temp_path, path)  # Consumers never see a half-written blob
+        return 'file://' + urllib.parse.quote(os.path.abspath(path))
+
+    def open(self, url):
+        """Memory-map the blob at url."""
+        return pa.memory_map(self.path(url))
+
+    def delete(self, url):
+        try:
+            os.remove(self.path(url))
+        except FileNotFoundError:
+            pass  # Already released by an earlier delivery
+
+
+STORES = {'file': LocalStore}
+
+
+def store_for(url):
+    """Blob store for a URL such as file:///app/blobs, or for the URL of one of its blobs."""
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in STORES:
+        raise ValueError(f"No blob store for {url}, known schemes are {sorted(STORES)}")
+    return STORES[parsed.scheme](urllib.parse.unquote(parsed.path))
+
+
+def schema_of(schema):
+    """Field names and types of an Arrow schema, without awkward's metadata."""
+    return schema.to_string(show_field_metadata=False, show_schema_metadata=False)
+
+
+def encode(array):
+    """Arrow IPC file bytes and schema of an awkward array."""
+    table = ak.to_arrow_table(array)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), table.schema
+
+
+def put(store, key, array):
+    """Write array to the store as the blob key and return the reference to publish in its place."""
+    data, schema = encode(array)
+    return {'url': store.put(key, data), 'size': len(data),
+            'sha256': hashlib.sha256(data).hexdigest(), 'schema': schema_of(schema)}
+
+
+def get(reference):
+    """Awkward array of the blob a reference points to, checked against its size, checksum and schema."""
+    # The arrays are views of the mapping, so it is left to close once they are gone
+    source = store_for(reference['url']).open(reference['url'])
+    if source.size() != reference['size']:
+        raise ValueError(f"{reference['url']} holds {source.size()} bytes, expected {reference['size']}")
+    if hashlib.sha256(memoryview(source.read_buffer())).hexdigest() != reference['sha256']:
+        raise ValueError(f"Checksum mismatch for {reference['url']}")
+    source.seek(0)
+    table = pa.ipc.open_file(source).read_all()
+    if schema_of(table.schema) != reference['schema']:
+        raise ValueError(f"Schema of {reference['url']} does not match its reference")
+    return ak.from_arrow(table)
+
+
+def release(reference):
+    """Delete the blob of a reference once its batch has been consumed."""
+    store_for(reference['url']).delete(reference['url'])
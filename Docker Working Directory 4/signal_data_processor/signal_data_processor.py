@@ -5,116 +5,181 @@ Created on Tue Apr 23 09:20:01 2024
 """
 
 import time
-import uproot
+import json
 import awkward as ak
 import vector
 import pika
-import pickle
+import filecache
+import reader
+import branches
+import skimcache
+import shards
+import histograms
+import kernels
+import jitkernels
+import codec
+import metrics
+import stream
+import wire
+import claimcheck
+from publisher import Publisher
 import infofile
-from config import samples, tuple_path
+from concurrent.futures import ProcessPoolExecutor
+from config import samples, tuple_path, run_id, workers, shard_index, shard_count, output_mode, engine, batch_size, confirm_window
+from config import results_exchange, runs_queue, queue_arguments, run_queue, blob_store, wire_format, extra_columns, weight_lumi
 
 # Constants for unit conversion
 MeV = 0.001
 GeV = 1.0
 
-def connect_to_rabbitmq():
-    """Establish a connection to RabbitMQ server."""
-    credentials = pika.PlainCredentials('user', 'password')
-    parameters = pika.ConnectionParameters('rabbitmq', 5672, '/', credentials)
-    return pika.BlockingConnection(parameters)
+# One long-lived connection for everything this processor publishes
+publisher = Publisher(confirm_window=confirm_window, exchange=results_exchange, queue_arguments=queue_arguments)
+
+# Event batches go to the blob store when one is configured, with only claim checks sent to the broker
+store = claimcheck.store_for(blob_store) if blob_store else None
+
+# Kernels of the numpy or numba compute engine (see kernels.py and jitkernels.py)
+compute = jitkernels if engine == 'numba' else kernels
 
 def publish_data(data, queue_name):
-    """Publish processed data to a specified RabbitMQ queue using pickle."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue=queue_name, durable=True)
-    pickled_data = pickle.dumps(data)
-    channel.basic_publish(
-        exchange='',
-        routing_key=queue_name,
-        body=pickled_data,
-        properties=pika.BasicProperties(
-            delivery_mode=2,  # Make message persistent
-        ))
-    print(f"Data published to RabbitMQ queue {queue_name}")
-    connection.close()
-
-def send_completion_message():
-    """Send a completion message to RabbitMQ."""
-    connection = connect_to_rabbitmq()
-    channel = connection.channel()
-    channel.queue_declare(queue='completion_queue', durable=True)
-    channel.basic_publish(
-        exchange='',
-        routing_key='completion_queue',
-        body='Processing completed',
-        properties=pika.BasicProperties(
+    """Publish a histogram message to a specified RabbitMQ queue in the wire format."""
+    with metrics.stage('serialize') as record:
+        body, encoding = codec.compress(wire.encode_histograms(data))
+        record['bytes'] = len(body)
+    with metrics.stage('publish') as record:
+        publisher.publish(run_queue(run_id, queue_name), body, pika.BasicProperties(
             delivery_mode=2,  # Make message persistent
+            content_type=wire.CONTENT_TYPE,
+            content_encoding=encoding,
+            headers={'run_id': run_id, 'shard_index': shard_index, 'shard_count': shard_count,
+                     'weight_lumi': weight_lumi},
         ))
-    print("Sent completion message to RabbitMQ.")
-    connection.close()
+        record['bytes'] = len(body)
+    print(f"Data published to RabbitMQ queue {run_queue(run_id, queue_name)}")
 
-def read_file(path, sample):
+def publish_stream(frames, sample_names, group, queue_name):
+    """Stream the events of each frame to a specified RabbitMQ queue as Arrow record batches."""
+    n_batches = stream.publish(publisher, run_queue(run_id, queue_name), frames, sample_names, batch_size,
+                               headers={'run_id': run_id, 'group': group, 'color': samples[group].get('color'),
+                                        'shard_index': shard_index, 'shard_count': shard_count,
+                                        'weight_lumi': weight_lumi},
+                               store=store, wire_format=wire_format, extra_columns=extra_columns)
+    print(f"Streamed {n_batches} batches to RabbitMQ queue {run_queue(run_id, queue_name)}")
+
+def announce_run():
+    """Announce this run so the plotter starts consuming its queues."""
+    publisher.publish(runs_queue, json.dumps({'run_id': run_id}), pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_type='application/json',
+    ))
+
+def send_completion_message(group, events):
+    """Send a completion message describing this shard's part of a sample group to RabbitMQ."""
+    publisher.flush()  # Only report completion once the broker holds every result
+    completion = {'run_id': run_id, 'group': group, 'shard_index': shard_index,
+                  'shard_count': shard_count, 'events': events}
+    publisher.publish(run_queue(run_id, 'completion_queue'), json.dumps(completion), pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_type='application/json',
+    ))
+    print(f"Sent completion message to RabbitMQ: {completion}")
+
+def read_file(path, sample, entry_start=0, entry_stop=None):
     print(f"\tProcessing: {sample}")
     start = time.time()
+    key = skimcache.skim_key(path, sample, [cut_mask, calc_weight, get_xsec_weight, calc_mllll], entry_start, entry_stop)
+    result = skimcache.load(key)
+    if result is not None:
+        print(f"\tLoaded {len(result)} events from skim {key} in {round(time.time() - start, 1)}s")
+        return result
     data_all = []
 
-    with uproot.open(path + ":mini") as tree:
-        numevents = tree.num_entries
-        for data in tree.iterate(['lep_pt', 'lep_eta', 'lep_phi', 'lep_E', 'lep_charge', 'lep_type',
-                                  'mcWeight', 'scaleFactor_PILEUP', 'scaleFactor_ELE', 'scaleFactor_MUON',
-                                  'scaleFactor_LepTRIGGER'],
-                                 library="ak", entry_stop=numevents):
-            data['totalWeight'] = calc_weight(data, sample)
-            data = apply_cuts(data)
-            data['mllll'] = calc_mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'])
+    with metrics.stage('open', sample) as record:
+        tree = filecache.open_tree(path)
+        record['events_out'], record['bytes'] = tree.num_entries, reader.bytes_read(tree)
+    with tree:
+        for chunk, data in enumerate(reader.iterate_selected(tree, branches.selection_branches(),
+                                                             branches.payload_branches(sample), cut_mask,
+                                                             entry_start, entry_stop, sample)):
+            with metrics.stage('mass', sample, chunk, len(data)) as record:
+                if engine in ('numpy', 'numba'):
+                    data['totalWeight'], data['mllll'] = compute.weight_and_mass(data, get_xsec_weight(sample), branches.WEIGHTS)
+                else:
+                    data['totalWeight'] = calc_weight(data, sample)
+                    data['mllll'] = calc_mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'])
+                record['events_out'] = len(data)
             data_all.append(data)
 
-    result = ak.concatenate(data_all)
+    with metrics.stage('concatenate', sample, events_in=sum(len(data) for data in data_all)) as record:
+        result = ak.concatenate(data_all)
+        record['events_out'] = len(result)
+    skimcache.save(result, key)
     elapsed = time.time() - start
     print(f"\tProcessed {len(result)} events in {round(elapsed, 1)}s")
     return result
 
 def calc_weight(data, sample):
     xsec_weight = get_xsec_weight(sample)
-    return (xsec_weight *
-            data.mcWeight *
-            data.scaleFactor_PILEUP *
-            data.scaleFactor_ELE *
-            data.scaleFactor_MUON *
-            data.scaleFactor_LepTRIGGER)
+    weight = xsec_weight
+    for name in branches.WEIGHTS:
+        weight = weight * data[name]
+    return weight
 
 def get_xsec_weight(sample):
+    """Cross-section weight normalising a sample to weight_lumi fb^-1; the plotter scales it to the data periods."""
     info = infofile.infos[sample]
-    lumi = 10  # Example luminosity in fb^-1
-    return (lumi * 1000 * info["xsec"]) / (info["sumw"] * info["red_eff"])
+    return (weight_lumi * 1000 * info["xsec"]) / (info["sumw"] * info["red_eff"])
 
-def apply_cuts(data):
+def cut_mask(data):
+    if engine in ('numpy', 'numba'):
+        return compute.cut_mask(data)
     charge_cut = (ak.sum(data['lep_charge'], axis=1) == 0)
     type_cut = ((ak.sum(data['lep_type'], axis=1) == 44) | 
                 (ak.sum(data['lep_type'], axis=1) == 48) |
                 (ak.sum(data['lep_type'], axis=1) == 52))
-    return data[charge_cut & type_cut]
+    return charge_cut & type_cut
 
 def calc_mllll(lep_pt, lep_eta, lep_phi, lep_E):
     p4 = vector.zip({"pt": lep_pt, "eta": lep_eta, "phi": lep_phi, "E": lep_E})
     return (p4[:, 0] + p4[:, 1] + p4[:, 2] + p4[:, 3]).mass * MeV
 
+def read_files(ranges):
+    """Read (path, sample, entry_start, entry_stop) ranges in parallel worker processes, returning the results in input order."""
+    if workers <= 1 or len(ranges) <= 1:
+        return [read_file(*entry_range) for entry_range in ranges]
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        for result, records in pool.map(metrics.traced(read_file), *zip(*ranges)):
+            metrics.merge(records)  # The workers' stages count towards this process's totals
+            results.append(result)
+    return results
+
 def get_data_from_files():
     data = {}
     print('Processing "Signal ($m_H$ = 125 GeV)" samples')
-    frames = []
-    for val in samples['Signal ($m_H$ = 125 GeV)']['list']:
-        fileString = tuple_path + "MC/mc_" + str(infofile.infos[val]["DSID"]) + "." + val + ".4lep.root"
-        temp = read_file(fileString, val)
-        frames.append(temp)
-    data['Signal ($m_H$ = 125 GeV)'] = ak.concatenate(frames)
-    publish_data(data['Signal ($m_H$ = 125 GeV)'], 'signal_data_queue')
-    send_completion_message()
+    sample_names = samples['Signal ($m_H$ = 125 GeV)']['list']
+    paths = [tuple_path + "MC/mc_" + str(infofile.infos[val]["DSID"]) + "." + val + ".4lep.root" for val in sample_names]
+    ranges = shards.shard_ranges(paths, sample_names)
+    print(f"Shard {shards.shard_id()} processing {len(ranges)} entry ranges")
+    frames = read_files(ranges)
+    with metrics.stage('concatenate', events_in=sum(len(frame) for frame in frames)) as record:
+        data['Signal ($m_H$ = 125 GeV)'] = ak.concatenate(frames)
+        record['events_out'] = len(data['Signal ($m_H$ = 125 GeV)'])
+    if output_mode == 'histograms':
+        publish_data(histograms.fill_group('Signal ($m_H$ = 125 GeV)', frames, [entry_range[1] for entry_range in ranges],
+                                          samples['Signal ($m_H$ = 125 GeV)'].get('color')), 'signal_data_queue')
+    else:
+        publish_stream(frames, [entry_range[1] for entry_range in ranges], 'Signal ($m_H$ = 125 GeV)', 'signal_data_queue')
+    send_completion_message('Signal ($m_H$ = 125 GeV)', len(data['Signal ($m_H$ = 125 GeV)']))
     return data
 
 if __name__ == "__main__":
+    metrics.serve()
     start = time.time()
+    announce_run()
     data = get_data_from_files()
+    publisher.close()
+    print(f"Publisher: {publisher.stats()}")
     elapsed = time.time() - start
     print(f"Time taken: {round(elapsed, 1)}s")
+    metrics.report()
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Tests import the shared modules from the root of Docker Working Directory 4."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
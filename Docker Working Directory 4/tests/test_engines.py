@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""The awkward, numpy and numba engines select the same events of a file, with the same mllll and totalWeight."""
+
+import importlib.util
+import os
+
+import awkward as ak
+import numpy as np
+import pytest
+import uproot
+
+import jitkernels
+import kernels
+import skimcache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = 'ggH125_ZZ4lep'
+ENGINES = ['awkward', 'numpy',
+           pytest.param('numba', marks=pytest.mark.skipif(not jitkernels.available, reason="numba not installed"))]
+
+
+@pytest.fixture(scope='module')
+def processor():
+    spec = importlib.util.spec_from_file_location(
+        'signal_data_processor', os.path.join(ROOT, 'signal_data_processor', 'signal_data_processor.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def tuple_file(tmp_path_factory):
+    """A 4lep file of random events with four or five leptons each, about half of which pass the cuts."""
+    rng = np.random.default_rng(7)
+    n_events = 5000
+    n_leptons = rng.integers(4, 6, n_events)
+    total = int(n_leptons.sum())
+
+    def jagged(values):
+        return ak.unflatten(values, n_leptons)
+
+    pt = rng.uniform(7e3, 80e3, total).astype(np.float32)
+    eta = rng.uniform(-2.5, 2.5, total).astype(np.float32)
+    branches = {
+        'lep_pt': jagged(pt), 'lep_eta': jagged(eta),
+        'lep_phi': jagged(rng.uniform(-np.pi, np.pi, total).astype(np.float32)),
+        'lep_E': jagged((pt * np.cosh(eta)).astype(np.float32)),
+        'lep_charge': jagged(rng.choice([-1, 1], total).astype(np.int32)),
+        'lep_type': jagged(rng.choice([11, 13], total).astype(np.uint32)),
+        'mcWeight': rng.normal(1, 0.1, n_events).astype(np.float32),
+    }
+    for name in ('scaleFactor_PILEUP', 'scaleFactor_ELE', 'scaleFactor_MUON', 'scaleFactor_LepTRIGGER'):
+        branches[name] = rng.uniform(0.9, 1.1, n_events).astype(np.float32)
+    path = str(tmp_path_factory.mktemp('tuples') / f'mc_345060.{SAMPLE}.4lep.root')
+    with uproot.recreate(path) as out:
+        # A TTree, as in the 4lep files, rather than the RNTuple that assigning a dict writes
+        out.mktree('mini', {name: values.type.content if isinstance(values, ak.Array) else values.dtype
+                            for name, values in branches.items()})
+        out['mini'].extend(branches)
+    return path
+
+
+def read(processor, path, engine, monkeypatch):
+    monkeypatch.setattr(skimcache, 'skim_dir', '')  # Every engine reads the file itself
+    monkeypatch.setattr(processor, 'engine', engine)
+    monkeypatch.setattr(processor, 'compute', jitkernels if engine == 'numba' else kernels)
+    return processor.read_file(path, SAMPLE)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_engines_agree(processor, tuple_file, engine, monkeypatch):
+    reference = read(processor, tuple_file, 'awkward', monkeypatch)
+    result = read(processor, tuple_file, engine, monkeypatch)
+    assert 0 < len(reference) < 5000
+    assert len(result) == len(reference)
+    np.testing.assert_allclose(ak.to_numpy(result['totalWeight']), ak.to_numpy(reference['totalWeight']), rtol=1e-6)
+    np.testing.assert_allclose(ak.to_numpy(result['mllll']), ak.to_numpy(reference['mllll']), rtol=1e-4)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""The read-through file cache against an in-process HTTP server with Range and ETag support."""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import filecache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves server.files, path -> (body, etag), honouring 'Range: bytes=N-' and cutting bodies short on request."""
+
+    def _head(self):
+        body, etag = self.server.files[self.path]
+        start = 0
+        if self.command == 'GET' and self.headers.get('Range'):
+            start = int(self.headers['Range'].split('=')[1].rstrip('-'))
+        self.send_response(206 if start else 200)
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('ETag', f'"{etag}"')
+        self.end_headers()
+        return body[start:]
+
+    def do_HEAD(self):
+        self.server.requests.append(('HEAD', self.path, None))
+        self._head()
+
+    def do_GET(self):
+        self.server.requests.append(('GET', self.path, self.headers.get('Range')))
+        body = self._head()
+        if self.server.cut_after is not None:
+            body, self.server.cut_after = body[:self.server.cut_after], None
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.files, server.requests, server.cut_after = {}, [], None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def new_process(monkeypatch):
+    """Start every test without the keys an earlier fetch remembered."""
+    monkeypatch.setattr(filecache, '_keys', {})
+
+
+def cached(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(('.root', '.part')))
+
+
+def test_download(server, tmp_path):
+    server.files['/a.root'] = (os.urandom(3000), 'v1')
+    path = filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6)
+    assert open(path, 'rb').read() == server.files['/a.root'][0]
+    assert cached(tmp_path) == [os.path.basename(path)]
+    # A hit neither asks the server again nor downloads the file
+    assert filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6) == path
+    assert [request[0] for request in server.requests] == ['HEAD', 'GET']
+
+
+def test_resume_after_truncated_download(server, tmp_path):
+    body = os.urandom(5000)
+    server.files['/a.root'] = (body, 'v1')
+    server.cut_after = 2000
+    with pytest.raises(Exception):
+        filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6)
+    part, = cached(tmp_path)
+    assert part.endswith('.part') and os.path.getsize(tmp_path / part) == 2000
+
+    path = filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6)
+    assert open(path, 'rb').read() == body
+    assert server.requests[-1] == ('GET', '/a.root', 'bytes=2000-')
+    assert cached(tmp_path) == [os.path.basename(path)]
+
+
+@pytest.mark.parametrize('change', ['etag', 'size'])
+def test_new_key_when_the_file_changes(server, tmp_path, monkeypatch, change):
+    server.files['/a.root'] = (b'x' * 1000, 'v1')
+    old = filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6)
+    server.files['/a.root'] = (b'y' * 1000, 'v2') if change == 'etag' else (b'y' * 1200, 'v1')
+    monkeypatch.setattr(filecache, '_keys', {})  # The change is seen by the next process
+    new = filecache.fetch(server.url + '/a.root', str(tmp_path), max_bytes=10**6)
+    assert new != old
+    assert open(new, 'rb').read() == server.files['/a.root'][0]
+
+
+def test_least_recently_used_evicted(server, tmp_path):
+    for name in 'abc':
+        server.files[f'/{name}.root'] = (os.urandom(1000), name)
+    budget = 2500  # Room for two files
+
+    def fetch(name):
+        time.sleep(0.01)  # Distinct modification times
+        return os.path.basename(filecache.fetch(server.url + f'/{name}.root', str(tmp_path), max_bytes=budget))
+
+    a, b = fetch('a'), fetch('b')
+    assert fetch('a') == a  # a is now used more recently than b
+    c = fetch('c')
+    assert cached(tmp_path) == sorted([a, c])
+    assert not any(name.endswith('.lock') and name != filecache.EVICT_LOCK for name in os.listdir(tmp_path))
+    # The file just fetched is kept even when it alone is over the budget
+    assert filecache.fetch(server.url + '/b.root', str(tmp_path), max_bytes=10).endswith(b)
+    assert cached(tmp_path) == [b]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""The NumPy and numba kernels against hand-built events and the awkward/vector path of the processors."""
+
+import awkward as ak
+import numpy as np
+import pytest
+
+import jitkernels
+import kernels
+
+
+@pytest.fixture(params=['numpy', pytest.param('numba', marks=pytest.mark.skipif(
+    not jitkernels.available, reason="numba not installed"))])
+def compute(request):
+    """Kernels module of an engine, as the processors pick it."""
+    return jitkernels if request.param == 'numba' else kernels
+
+
+def chunk(leptons, weights=None):
+    """Record array of events given as lists of (charge, type, pt, eta, phi) leptons, E from a massless lepton."""
+    def branch(column, dtype):
+        return ak.values_astype(ak.Array([[lepton[column] for lepton in event] for event in leptons]), dtype)
+
+    pt, eta = branch(2, np.float32), branch(3, np.float32)
+    fields = {'lep_charge': branch(0, np.int32), 'lep_type': branch(1, np.uint32),
+              'lep_pt': pt, 'lep_eta': eta, 'lep_phi': branch(4, np.float32),
+              'lep_E': ak.values_astype(pt * np.cosh(eta), np.float32)}
+    if weights is not None:
+        fields['mcWeight'] = np.asarray(weights, dtype=np.float32)
+    return ak.zip(fields, depth_limit=1)
+
+
+def lepton(charge, flavour, pt=20e3, eta=0.5, phi=0.0):
+    return (charge, flavour, pt, eta, phi)
+
+
+def test_cut_mask(compute):
+    events = chunk([
+        [lepton(1, 11), lepton(-1, 11), lepton(1, 11), lepton(-1, 11)],  # eeee
+        [lepton(1, 11), lepton(-1, 11), lepton(1, 13), lepton(-1, 13)],  # eemumu
+        [lepton(1, 13), lepton(-1, 13), lepton(1, 13), lepton(-1, 13), lepton(1, 13), lepton(-1, 13)],
+        [lepton(1, 13), lepton(-1, 13), lepton(1, 13), lepton(1, 13)],  # Charge +2
+        [lepton(1, 11), lepton(-1, 11), lepton(1, 13)],  # Three leptons
+        [lepton(1, 11), lepton(-1, 13), lepton(1, 13), lepton(-1, 13)],  # emumumu
+        [],
+    ])
+    assert compute.cut_mask(events).tolist() == [True, True, False, False, False, False, False]
+
+
+def test_selected_events_of_a_sliced_chunk():
+    # Selecting events leaves an IndexedArray under the record fields, which _flat resolves without copying
+    events = chunk([[lepton(1, 11, pt=(100 * event + i) * 1e3) for i in range(n)]
+                    for event, n in enumerate((4, 5, 4, 6))])[np.array([False, True, True, True])]
+    np.testing.assert_array_equal(kernels.first_four(events['lep_pt'], events=[0, 2])[:, 0], [100e3, 300e3])
+    np.testing.assert_array_equal(kernels.first_four(events['lep_pt'], events=[1])[0], [200e3, 201e3, 202e3, 203e3])
+
+
+def test_mllll_of_back_to_back_leptons(compute):
+    # Two pairs of massless leptons back to back in the transverse plane: the mass is the sum of the energies
+    events = chunk([[lepton(1, 11, 30e3, 0, 0), lepton(-1, 11, 30e3, 0, np.pi),
+                     lepton(1, 13, 15e3, 0, np.pi / 2), lepton(-1, 13, 15e3, 0, -np.pi / 2)]])
+    np.testing.assert_allclose(compute.mllll(events['lep_pt'], events['lep_eta'], events['lep_phi'], events['lep_E']),
+                               [90.0], rtol=1e-6)
+
+
+def test_mllll_of_selected_events(compute):
+    data = kernels._random_chunk(200)
+    selected = data[kernels.cut_mask(data)]  # Record fields over an IndexedArray
+    events = np.flatnonzero(kernels.cut_mask(data))
+    np.testing.assert_allclose(
+        compute.mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'], events=events),
+        compute.mllll(selected['lep_pt'], selected['lep_eta'], selected['lep_phi'], selected['lep_E']), rtol=1e-12)
+
+
+def test_total_weight_of_selected_events(compute):
+    events = chunk([[lepton(1, 11)] * 4] * 3, weights=[1.0, 2.0, 4.0])
+    np.testing.assert_array_equal(compute.total_weight(events, 0.5, ['mcWeight']), [0.5, 1.0, 2.0])
+    np.testing.assert_array_equal(compute.total_weight(events, 0.5, ['mcWeight'], events=np.array([2])), [2.0])
+    np.testing.assert_array_equal(compute.total_weight(events, 0.5, []), [0.5, 0.5, 0.5])
+
+
+@pytest.mark.parametrize('n_events', [0, 1000])
+def test_fused_matches_awkward_vector(compute, n_events):
+    data = kernels._random_chunk(n_events)
+    weights = ['mcWeight', 'scaleFactor_PILEUP']
+    reference_mask, reference_weight, reference_mass = kernels._reference(data, 0.5, weights)
+    mask, weight, mass = compute.fused(data, 0.5, weights)
+    np.testing.assert_array_equal(mask, ak.to_numpy(reference_mask))
+    np.testing.assert_allclose(weight, ak.to_numpy(reference_weight), rtol=1e-6)
+    np.testing.assert_allclose(mass, ak.to_numpy(reference_mass), rtol=1e-4)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Windowed publisher confirms against the in-process broker stand-in."""
+
+import pika
+import pytest
+
+import publisher
+from publisher import Publisher
+from publisher_benchmark import StandInBroker
+
+
+class _NackingBroker(StandInBroker):
+    """Stand-in that nacks the first to_nack messages it receives and acks the rest."""
+
+    to_nack = 1
+
+    def process_data_events(self, time_limit=0):
+        if self.to_nack and self.pending:
+            self.to_nack -= 1
+            _, tag = self.pending.pop(0)
+            self.ack_callback(pika.frame.Method(1, pika.spec.Basic.Nack(delivery_tag=tag, multiple=False)))
+            return
+        super().process_data_events(time_limit)
+
+
+def _publish(broker, n_messages, window):
+    sender = Publisher(confirm_window=window, connection_class=broker)
+    for i in range(n_messages):
+        sender.publish('test_queue', str(i).encode(), pika.BasicProperties(delivery_mode=2))
+    sender.flush()
+    return sender
+
+
+@pytest.mark.parametrize('window', [1, 4, 64])
+def test_every_message_confirmed(window):
+    sender = _publish(lambda parameters: StandInBroker(parameters, round_trip=0.0001), 50, window)
+    assert not sender.unconfirmed and not sender.nacked
+    assert len(sender.confirm_latencies) == 50
+    assert sender.retransmitted == 0
+
+
+def test_nacked_message_sent_again():
+    sender = _publish(lambda parameters: _NackingBroker(parameters, round_trip=0.0001), 20, 8)
+    assert not sender.unconfirmed and not sender.nacked
+    assert sender.retransmitted == 1
+    assert len(sender.publish_latencies) == 21
+
+
+def test_nack_storm_does_not_recurse():
+    class Storm(_NackingBroker):
+        to_nack = 3000  # More than the recursion limit
+
+    sender = _publish(lambda parameters: Storm(parameters, round_trip=0), 2, 1)
+    assert not sender.unconfirmed and not sender.nacked
+    assert sender.retransmitted == 3000
+
+
+def test_confirms_need_pika_1(monkeypatch):
+    monkeypatch.setattr(pika, '__version__', '2.0.0')
+    with pytest.raises(RuntimeError, match='HZZ_CONFIRM_WINDOW=0'):
+        Publisher(confirm_window=8, connection_class=StandInBroker).publish('test_queue', b'')
+    # Without confirms the asynchronous channel isn't needed
+    Publisher(confirm_window=0, connection_class=StandInBroker).publish('test_queue', b'')
+
+
+def test_async_channel_of_blocking_channel():
+    channel = pika.adapters.blocking_connection.BlockingChannel.__new__(
+        pika.adapters.blocking_connection.BlockingChannel)
+    channel._impl = object()
+    assert publisher.async_channel(channel) is channel._impl
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Versioned binary wire format of processed results.
+
+A message is a fixed preamble (magic, format version, header length), a JSON
+header and the column buffers, each starting on an 8 byte boundary:
+
+    b'HZZW' | version uint16 | reserved uint16 | header length uint32 | header | buffers
+
+The header holds the message's metadata (kind, sample group, colour, ...) and,
+for every column, its name, NumPy dtype, byte offset and length. Jagged columns
+also point to a buffer of int64 offsets. Decoding wraps each buffer with
+np.frombuffer, so no column is copied. Unlike pickle, reading a message runs
+no code and does not depend on the library versions that wrote it.
+
+Event batches carry mllll, totalWeight (simulation only), the per-event sum of
+lep_type that names the decay channel, and any extra columns asked for.
+Histogram messages carry only the non-empty bins of each histogram, as their
+index and float32 sums of weights (summed in float64 once read), with the sum of squared weights left out where it
+equals the sum of weights (collision data). Uniform bin edges are sent as
+their range and count. When the samples are split by decay channel only the
+channel histograms are sent, and the reader sums them into the histograms of
+each sample and of the group, so a message grows with the number of filled
+bins, not with the 5000 bins of the master grid. Run this file to compare it
+with pickle, JSON and Arrow.
+"""
+
+import sys
+import json
+import time
+import struct
+import pickle
+
+import numpy as np
+import awkward as ak
+
+CONTENT_TYPE = 'application/vnd.hzz.wire'
+MAGIC = b'HZZW'
+VERSION = 2  # Bump on changes old readers can't skip over; new header keys are ignored by old readers
+_PREAMBLE = struct.Struct('<4sHHI')
+_ALIGN = 8
+
+
+def encode(columns, metadata=None):
+    """Message holding flat or singly jagged columns, given as a dict of name -> array, and metadata."""
+    entries, buffers, offset = [], [], 0
+
+    def add_buffer(array):
+        nonlocal offset
+        array = np.ascontiguousarray(array)
+        entry = {'dtype': array.dtype.str, 'offset': offset, 'count': len(array)}
+        buffers.append((entry, array))
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+        return entry
+
+    for name, array in columns.items():
+        layout = ak.to_layout(ak.to_packed(array)) if isinstance(array, ak.Array) else None
+        if isinstance(layout, ak.contents.ListOffsetArray):
+            entry = dict(add_buffer(np.asarray(layout.content.data)), name=name)
+            entry['offsets'] = add_buffer(np.asarray(layout.offsets, dtype=np.int64))
+        else:
+            entry = dict(add_buffer(ak.to_numpy(array) if layout is not None else np.asarray(array)), name=name)
+        entries.append(entry)
+
+    header = json.dumps({'metadata': metadata or {}, 'columns': entries}).encode()
+    start = -(-(_PREAMBLE.size + len(header)) // _ALIGN) * _ALIGN
+    body = bytearray(start + offset)
+    body[:_PREAMBLE.size + len(header)] = _PREAMBLE.pack(MAGIC, VERSION, 0, len(header)) + header
+    view = memoryview(body)
+    for entry, array in buffers:
+        view[start + entry['offset']:start + entry['offset'] + array.nbytes] = array.reshape(-1).view(np.uint8)
+    return bytes(body)
+
+
+def decode(body):
+    """Metadata and dict of name -> NumPy view (or awkward array for jagged columns) of a message."""
+    magic, version, _, header_length = _PREAMBLE.unpack_from(body)
+    if magic != MAGIC:
+        raise ValueError("Not a wire format message")
+    if version > VERSION:
+        raise ValueError(f"Wire format version {version} is newer than the supported version {VERSION}")
+    header = json.loads(bytes(body[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+    start = -(-(_PREAMBLE.size + header_length) // _ALIGN) * _ALIGN
+
+    def view(entry):
+        return np.frombuffer(body, dtype=entry['dtype'], count=entry['count'], offset=start + entry['offset'])
+
+    columns = {}
+    for entry in header['columns']:
+        if 'offsets' in entry:
+            columns[entry['name']] = ak.Array(ak.contents.ListOffsetArray(
+                ak.index.Index64(view(entry['offsets'])), ak.contents.NumpyArray(view(entry))))
+        else:
+            columns[entry['name']] = view(entry)
+    return header['metadata'], columns
+
+
+def encode_events(frame, metadata, extra_columns=()):
+    """Message of an event batch with mllll, totalWeight if it has one, the sum of lep_type, and the extra columns
+    it has."""
+    names = ['mllll'] + [name for name in ['totalWeight', *extra_columns] if name in frame.fields]
+    columns = {name: frame[name] for name in names}
+    if 'lep_type' in frame.fields:
+        columns['lep_type_sum'] = ak.to_numpy(ak.sum(frame['lep_type'], axis=1)).astype(np.int8)  # 44 to 52
+    return encode(columns, dict(metadata, kind='events'))
+
+
+def decode_events(body):
+    """Metadata and awkward record array of an event batch message, built on views of its buffers."""
+    metadata, columns = decode(body)
+    return metadata, ak.Array(columns)
+
+
+def _add_sparse(columns, prefix, hist):
+    """Add the non-empty bins of hist to columns: their index, sumw, and sumw2 unless it equals sumw."""
+    bins = np.flatnonzero((hist['sumw'] != 0) | (hist['sumw2'] != 0))
+    columns[f'{prefix}.bins'] = bins.astype(np.uint16 if len(hist['sumw']) <= 1 << 16 else np.uint32)
+    columns[f'{prefix}.sumw'] = hist['sumw'][bins].astype(np.float32)
+    if not np.array_equal(hist['sumw2'], hist['sumw']):
+        columns[f'{prefix}.sumw2'] = hist['sumw2'][bins].astype(np.float32)
+
+
+def _dense(columns, prefix, bin_edges):
+    """Histogram over bin_edges of the non-empty bins stored under prefix."""
+    bins = columns[f'{prefix}.bins']
+    sumw = np.zeros(len(bin_edges) - 1)
+    sumw[bins] = columns[f'{prefix}.sumw']
+    if f'{prefix}.sumw2' in columns:
+        sumw2 = np.zeros(len(bin_edges) - 1)
+        sumw2[bins] = columns[f'{prefix}.sumw2']
+    else:
+        sumw2 = sumw.copy()
+    return {'bin_edges': bin_edges, 'sumw': sumw, 'sumw2': sumw2}
+
+
+def _sum(hists, bin_edges):
+    return {'bin_edges': bin_edges, 'sumw': np.sum([hist['sumw'] for hist in hists], axis=0),
+            'sumw2': np.sum([hist['sumw2'] for hist in hists], axis=0)}
+
+
+def encode_histograms(message):
+    """Message of the non-empty bins of a histogram message from histograms.fill_group."""
+    samples = list(message['samples'])
+    bin_edges = np.asarray(message['total']['bin_edges'])
+    channels = list(next(iter(message['channels'].values()))) if message.get('channels') else []
+    metadata = {'kind': 'histograms', 'group': message['group'], 'color': message['color'],
+                'samples': samples, 'channels': channels}
+    columns = {}
+    if np.array_equal(np.linspace(bin_edges[0], bin_edges[-1], len(bin_edges)), bin_edges):
+        metadata['binning'] = [float(bin_edges[0]), float(bin_edges[-1]), len(bin_edges) - 1]
+    else:
+        columns['bin_edges'] = bin_edges
+    if not channels:
+        _add_sparse(columns, 'total', message['total'])
+    for index, sample in enumerate(samples):
+        if not channels:
+            _add_sparse(columns, f'sample{index}', message['samples'][sample])
+        for channel in channels:  # The sample and group histograms are their sums
+            _add_sparse(columns, f'sample{index}.{channel}', message['channels'][sample][channel])
+    return encode(columns, metadata)
+
+
+def decode_histograms(body):
+    """Histogram message, as histograms.fill_group returns it, of a wire format message."""
+    metadata, columns = decode(body)
+    if 'binning' in metadata:
+        first, last, n_bins = metadata['binning']
+        bin_edges = np.linspace(first, last, n_bins + 1)
+    else:
+        bin_edges = columns['bin_edges']
+
+    def histogram(prefix):
+        if f'{prefix}.bins' not in columns:  # Dense, from a version 1 producer
+            return {'bin_edges': bin_edges, 'sumw': columns[f'{prefix}.sumw'], 'sumw2': columns[f'{prefix}.sumw2']}
+        return _dense(columns, prefix, bin_edges)
+
+    samples = metadata['samples']
+    message = {'kind': 'histograms', 'group': metadata['group'], 'color': metadata['color']}
+    if metadata.get('channels'):  # Written by producers that split samples by decay channel
+        message['channels'] = {sample: {channel: histogram(f'sample{index}.{channel}')
+                                        for channel in metadata['channels']}
+                               for index, sample in enumerate(samples)}
+    if 'total.sumw' in columns:
+        message['samples'] = {sample: histogram(f'sample{index}') for index, sample in enumerate(samples)}
+        message['total'] = histogram('total')
+    else:
+        message['samples'] = {sample: _sum(message['channels'][sample].values(), bin_edges) for sample in samples}
+        message['total'] = _sum(message['samples'].values(), bin_edges) if samples else \
+            {'bin_edges': bin_edges, 'sumw': np.zeros(len(bin_edges) - 1), 'sumw2': np.zeros(len(bin_edges) - 1)}
+    return message
+
+
+def benchmark(n_events, repeats=5):
+    """Time and size of an event batch sent as pickle, JSON (Docker Working Directory 3), Arrow and wire format."""
+    import stream
+
+    import histograms
+
+    rng = np.random.default_rng(1)
+    frame = ak.Array({'mllll': rng.uniform(80, 250, n_events), 'totalWeight': rng.normal(1e-3, 1e-4, n_events),
+                      'lep_pt': ak.unflatten(rng.exponential(3e4, 4 * n_events).astype(np.float32),
+                                             np.full(n_events, 4)),
+                      'lep_type': ak.unflatten(  # 4e, 2e2mu or 4mu
+                          np.array([[11] * 4, [11, 11, 13, 13], [13] * 4], dtype=np.uint32)[
+                              rng.integers(0, 3, n_events)].reshape(-1), np.full(n_events, 4))})
+    metadata = {'group': r'Background $ZZ^*$', 'color': '#ff0000', 'sample': 'llll'}
+    paths = {
+        'pickle': (lambda: pickle.dumps(frame), pickle.loads),
+        'json': (lambda: json.dumps(ak.to_list(frame)), lambda body: ak.Array(json.loads(body))),
+        'arrow': (lambda: stream.encode(frame), stream.decode),
+        'wire': (lambda: encode_events(frame, metadata, ['lep_pt']), lambda body: decode_events(body)[1]),
+    }
+
+    def best_time(function, *args):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = function(*args)
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    for name, (dumps, loads) in paths.items():
+        encode_time, body = best_time(dumps)
+        decode_time, decoded = best_time(loads, body)
+        assert np.allclose(np.asarray(decoded['mllll']), np.asarray(frame['mllll']))
+        print(f"\t{name:<7} {len(body) / 1e6:8.2f} MB  encode {encode_time * 1000:8.1f} ms  "
+              f"decode {decode_time * 1000:8.1f} ms")
+
+    # The histograms of a batch are a few kilobytes at most, and once the header is paid for never more than its events
+    message = histograms.fill_group(metadata['group'], [frame], [metadata['sample']], metadata['color'])
+    events_size = len(encode_events(frame, metadata))
+    encode_time, body = best_time(encode_histograms, message)
+    decode_time, decoded = best_time(decode_histograms, body)
+    assert np.allclose(decoded['total']['sumw'], message['total']['sumw'], rtol=1e-6)
+    assert np.allclose(decoded['channels']['llll']['4mu']['sumw2'], message['channels']['llll']['4mu']['sumw2'],
+                       rtol=1e-6)
+    assert len(body) <= max(events_size, 4096), f"{len(body)} B of histograms for {events_size} B of events"
+    print(f"\thistograms {len(body) / 1e6:5.2f} MB  encode {encode_time * 1000:8.1f} ms  "
+          f"decode {decode_time * 1000:8.1f} ms  ({events_size / 1e6:.2f} MB as events)")
+
+
+if __name__ == "__main__":
+    # python wire.py [events] compares the formats on a batch of mllll, totalWeight and lep_pt
+    for n_events in ([int(sys.argv[1])] if len(sys.argv) > 1 else (10_000, 100_000)):
+        print(f"{n_events} events:")
+        benchmark(n_events, repeats=1 if n_events > 100_000 else 5)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Parquet cache of post-selection events.
+
+Each skim is keyed by a hash of everything that decides its contents: the input
+file and entry range, the branch plan, the source of the cut/weight/mass
+functions and the sample's infofile entry. Changing any of them gives a new
+key, so stale skims are never read back.
+"""
+
+import os
+import json
+import hashlib
+import inspect
+
+import awkward as ak
+
+import branches
+import kernels
+import jitkernels
+import infofile
+from config import skim_dir, engine
+
+SKIM_VERSION = 1  # Bump when the skim layout changes
+
+
+def skim_key(path, sample, functions, entry_start=0, entry_stop=None):
+    """Hash of the inputs, selection and code that produce the skim of one file or entry range."""
+    provenance = {
+        'version': SKIM_VERSION,
+        'path': path,
+        'sample': sample,
+        'entries': [entry_start, entry_stop],
+        'branches': branches.plan(sample),
+        'cuts': branches.CUTS,
+        'info': infofile.infos.get(sample),
+        'engine': engine,
+        'code': [inspect.getsource(function) for function in functions] +
+                ([inspect.getsource(kernels)] if engine in ('numpy', 'numba') else []) +
+                ([inspect.getsource(jitkernels)] if engine == 'numba' else []),
+    }
+    digest = hashlib.sha256(json.dumps(provenance, sort_keys=True).encode()).hexdigest()
+    return f"{sample}-{digest[:16]}"
+
+
+def skim_path(key):
+    return os.path.join(skim_dir, key + '.parquet')
+
+
+def load(key):
+    """Return the cached skim for key, or None if there isn't one."""
+    if not skim_dir or not os.path.exists(skim_path(key)):
+        return None
+    return ak.from_parquet(skim_path(key))
+
+
+def save(array, key):
+    """Write array as the skim for key."""
+    if not skim_dir:
+        return
+    os.makedirs(skim_dir, exist_ok=True)
+    path = skim_path(key)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    ak.to_parquet(array, temp_path)
+    os.replace(temp_path, path)  # Readers never see a half-written skim
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming of event arrays over RabbitMQ as Arrow IPC record batches.
+
+A result is sent as a sequence of messages that each hold an Arrow IPC stream
+of at most batch_size events, numbered by a seq header, followed by an
+end-of-stream message with an empty body that carries the number of batches.
+The consumer folds each batch in as it arrives, so neither side ever holds the
+whole result in one message. Batches are Arrow IPC streams, or wire format
+messages of only the columns the plotter needs (see wire.py). Inline batches are compressed with the configured
+codec (see codec.py). Given a blob store, each batch is written to it
+and its message only carries a claim-check reference (see claimcheck.py).
+"""
+
+import json
+import hashlib
+
+import pika
+import pyarrow as pa
+import awkward as ak
+
+import wire
+import codec
+import metrics
+import claimcheck
+
+CONTENT_TYPE = 'application/vnd.apache.arrow.stream'
+
+
+def encode(array):
+    """Arrow IPC stream bytes of an awkward array."""
+    table = ak.to_arrow_table(array)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode(body):
+    """Awkward array of the Arrow IPC stream in body."""
+    return ak.from_arrow(pa.ipc.open_stream(body).read_all())
+
+
+def stream_id(headers):
+    """Id of the stream of a result, the same every time the same part of a run is sent again."""
+    part = [(headers or {}).get(key) for key in ('run_id', 'group', 'sample', 'shard_index', 'shard_count',
+                                                 'task_index', 'task_count', 'entry_start', 'entry_stop')]
+    return hashlib.sha1(json.dumps(part, default=str).encode()).hexdigest()
+
+
+def batches(array, batch_size):
+    """Consecutive slices of array with at most batch_size events."""
+    for start in range(0, len(array), max(batch_size, 1)):
+        yield array[start:start + batch_size]
+
+
+def is_stream(properties):
+    """Return True for messages that are part of a batch stream."""
+    if properties is None:
+        return False
+    if properties.content_type == wire.CONTENT_TYPE:
+        return 'stream' in (properties.headers or {})  # Histogram messages use the wire format too
+    return properties.content_type in (CONTENT_TYPE, claimcheck.CONTENT_TYPE)
+
+
+def read(properties, body):
+    """Awkward array of a batch message, fetched from the blob store if it holds a claim check."""
+    if properties.content_type == claimcheck.CONTENT_TYPE:
+        return claimcheck.get(json.loads(body))
+    if properties.content_type == wire.CONTENT_TYPE:
+        return wire.decode_events(codec.decompress(body, properties))[1]
+    return decode(codec.decompress(body, properties))
+
+
+def release(properties, body):
+    """Delete the blob of a consumed batch message that holds a claim check."""
+    if properties.content_type == claimcheck.CONTENT_TYPE:
+        claimcheck.release(json.loads(body))
+
+
+def publish(publisher, queue_name, frames, sample_names, batch_size, headers=None, store=None,
+            wire_format='arrow', extra_columns=()):
+    """Publish frames as one stream of batches tagged with their sample, and return the number of batches.
+
+    With a blob store each batch is written to it, and only its reference is published. With the
+    'wire' format inline batches only carry mllll, totalWeight and extra_columns. The stream id is
+    derived from the run, group and part in headers, so a part published again, e.g. by a retried
+    task, reuses it and the consumer folds each of its batches once.
+    """
+    stream = stream_id(headers)
+    seq = 0
+
+    def send(body, extra, content_type=CONTENT_TYPE, content_encoding=None):
+        publisher.publish(queue_name, body, pika.BasicProperties(
+            delivery_mode=2,  # Make message persistent
+            content_type=content_type,
+            content_encoding=content_encoding,
+            headers=dict(headers or {}, stream=stream, seq=seq, **extra),
+        ))
+
+    for frame, sample in zip(frames, sample_names):
+        for chunk, batch in enumerate(batches(frame, batch_size)):
+            with metrics.stage('serialize', sample, chunk, len(batch)) as record:
+                if store is None:
+                    if wire_format == 'wire':
+                        metadata = {'group': (headers or {}).get('group'), 'color': (headers or {}).get('color'),
+                                    'sample': sample}
+                        body, content_type = wire.encode_events(batch, metadata, extra_columns), wire.CONTENT_TYPE
+                    else:
+                        body, content_type = encode(batch), CONTENT_TYPE
+                    body, encoding = codec.compress(body)
+                    record['bytes'] = len(body)
+                else:
+                    key = f"{(headers or {}).get('run_id', 'default')}/{stream}-{seq}.arrow"
+                    reference = claimcheck.put(store, key, batch)
+                    body, encoding, content_type = json.dumps(reference), None, claimcheck.CONTENT_TYPE
+                    record['bytes'] = reference['size']
+            with metrics.stage('publish', sample, chunk) as record:
+                send(body, {'sample': sample, 'eos': False}, content_type, encoding)
+                record['bytes'] = len(body)
+            seq += 1
+
+    # The end-of-stream marker tells the consumer how many batches to expect. It is held back until the
+    # broker has confirmed every batch, so no batch is sent again after it
+    publisher.flush()
+    send(b'', {'eos': True, 'batches': seq})
+    return seq
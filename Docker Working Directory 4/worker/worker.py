@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Generic worker pulling entry-range tasks of any sample from the work queue.
+"""
+
+import os
+import json
+import time
+import awkward as ak
+import vector
+import pika
+import filecache
+import reader
+import branches
+import skimcache
+import histograms
+import kernels
+import jitkernels
+import codec
+import metrics
+import stream
+import wire
+import claimcheck
+from publisher import Publisher
+import infofile
+from time import sleep
+from config import samples, result_queues, task_queue, task_retries, output_mode, engine, batch_size, confirm_window
+from config import results_exchange, runs_queue, queue_arguments, run_queue, blob_store, wire_format, extra_columns, weight_lumi
+
+# Constants for unit conversion
+MeV = 0.001
+GeV = 1.0
+
+# Results go out over their own long-lived connection, separate from the one tasks arrive on
+publisher = Publisher(confirm_window=confirm_window, exchange=results_exchange, queue_arguments=queue_arguments)
+
+# Event batches go to the blob store when one is configured, with only claim checks sent to the broker
+store = claimcheck.store_for(blob_store) if blob_store else None
+
+# Kernels of the numpy or numba compute engine (see kernels.py and jitkernels.py)
+compute = jitkernels if engine == 'numba' else kernels
+
+# Runs this worker has already announced to the plotter
+announced_runs = set()
+
+def connect_to_rabbitmq():
+    """Establish a connection to RabbitMQ server with retry logic."""
+    credentials = pika.PlainCredentials(os.getenv('RABBITMQ_DEFAULT_USER', 'user'),
+                                        os.getenv('RABBITMQ_DEFAULT_PASS', 'password'))
+    host = os.getenv('RABBITMQ_HOST', 'rabbitmq')
+    port = int(os.getenv('RABBITMQ_PORT', '5672'))
+
+    for _ in range(5):  # Retry up to 5 times
+        try:
+            parameters = pika.ConnectionParameters(host=host, port=port, virtual_host='/',
+                                                   credentials=credentials, connection_attempts=3,
+                                                   retry_delay=5, socket_timeout=5,
+                                                   heartbeat=600)  # Long tasks block the heartbeat
+            return pika.BlockingConnection(parameters)
+        except pika.exceptions.AMQPConnectionError as e:
+            print("Failed to connect to RabbitMQ, retrying...")
+            sleep(5)
+    raise Exception("Failed to connect to RabbitMQ after multiple attempts.")
+
+def read_file(path, sample, entry_start=0, entry_stop=None):
+    print(f"\tProcessing: {sample} entries {entry_start}-{entry_stop}")
+    start = time.time()
+    functions = [cut_mask, calc_mllll] if branches.is_data(sample) else [cut_mask, calc_weight, get_xsec_weight, calc_mllll]
+    key = skimcache.skim_key(path, sample, functions, entry_start, entry_stop)
+    result = skimcache.load(key)
+    if result is not None:
+        print(f"\tLoaded {len(result)} events from skim {key} in {round(time.time() - start, 1)}s")
+        return result
+    data_all = []
+
+    with metrics.stage('open', sample) as record:
+        tree = filecache.open_tree(path)
+        record['events_out'], record['bytes'] = tree.num_entries, reader.bytes_read(tree)
+    with tree:
+        for chunk, data in enumerate(reader.iterate_selected(tree, branches.selection_branches(),
+                                                             branches.payload_branches(sample), cut_mask,
+                                                             entry_start, entry_stop, sample)):
+            with metrics.stage('mass', sample, chunk, len(data)) as record:
+                if engine in ('numpy', 'numba'):
+                    xsec_weight = None if branches.is_data(sample) else get_xsec_weight(sample)
+                    weight, data['mllll'] = compute.weight_and_mass(data, xsec_weight, branches.WEIGHTS)
+                    if weight is not None:
+                        data['totalWeight'] = weight
+                else:
+                    if not branches.is_data(sample):
+                        data['totalWeight'] = calc_weight(data, sample)
+                    data['mllll'] = calc_mllll(data['lep_pt'], data['lep_eta'], data['lep_phi'], data['lep_E'])
+                record['events_out'] = len(data)
+            data_all.append(data)
+
+    with metrics.stage('concatenate', sample, events_in=sum(len(data) for data in data_all)) as record:
+        result = ak.concatenate(data_all)
+        record['events_out'] = len(result)
+    skimcache.save(result, key)
+    elapsed = time.time() - start
+    print(f"\tProcessed {len(result)} events in {round(elapsed, 1)}s")
+    return result
+
+def calc_weight(data, sample):
+    xsec_weight = get_xsec_weight(sample)
+    weight = xsec_weight
+    for name in branches.WEIGHTS:
+        weight = weight * data[name]
+    return weight
+
+def get_xsec_weight(sample):
+    """Cross-section weight normalising a sample to weight_lumi fb^-1; the plotter scales it to the data periods."""
+    info = infofile.infos[sample]
+    return (weight_lumi * 1000 * info["xsec"]) / (info["sumw"] * info["red_eff"])
+
+def cut_mask(data):
+    if engine in ('numpy', 'numba'):
+        return compute.cut_mask(data)
+    charge_cut = (ak.sum(data['lep_charge'], axis=1) == 0)
+    type_cut = ((ak.sum(data['lep_type'], axis=1) == 44) |
+                (ak.sum(data['lep_type'], axis=1) == 48) |
+                (ak.sum(data['lep_type'], axis=1) == 52))
+    return charge_cut & type_cut
+
+def calc_mllll(lep_pt, lep_eta, lep_phi, lep_E):
+    p4 = vector.zip({"pt": lep_pt, "eta": lep_eta, "phi": lep_phi, "E": lep_E})
+    return (p4[:, 0] + p4[:, 1] + p4[:, 2] + p4[:, 3]).mass * MeV
+
+def task_callback(ch, method, properties, body):
+    """Process one task and publish its result to the queue of its sample group."""
+    task = json.loads(body)
+    try:
+        result = read_file(task['path'], task['sample'], task['entry_start'], task['entry_stop'])
+    except Exception as e:
+        fail_task(ch, method, properties, task, e)
+        return
+
+    announce_run(task['run_id'])
+    queue_name = run_queue(task['run_id'], result_queues[task['group']])
+    headers = {key: task[key] for key in ('run_id', 'group', 'sample', 'entry_start', 'entry_stop',
+                                          'task_index', 'task_count')}
+    headers['weight_lumi'] = weight_lumi
+    events = len(result)
+    if output_mode == 'histograms':
+        result = histograms.fill_group(task['group'], [result], [task['sample']], samples[task['group']].get('color'))
+        with metrics.stage('serialize', task['sample'], task['task_index']) as record:
+            body, encoding = codec.compress(wire.encode_histograms(result))
+            record['bytes'] = len(body)
+        with metrics.stage('publish', task['sample'], task['task_index']) as record:
+            publisher.publish(queue_name, body, pika.BasicProperties(
+                delivery_mode=2,  # Make message persistent
+                content_type=wire.CONTENT_TYPE,
+                content_encoding=encoding,
+                headers=headers,
+            ))
+            record['bytes'] = len(body)
+    else:
+        stream.publish(publisher, queue_name, [result], [task['sample']], batch_size,
+                       headers=dict(headers, color=samples[task['group']].get('color')), store=store,
+                       wire_format=wire_format, extra_columns=extra_columns)
+    send_completion_message(task, events)
+    # Only acknowledge once the broker has confirmed the result, so a lost task is redelivered
+    publisher.flush()
+    ch.basic_ack(delivery_tag=method.delivery_tag)
+    print(f"Published task {task['task_index'] + 1}/{task['task_count']} "
+          f"of {task['group']} to RabbitMQ queue {queue_name}")
+
+def fail_task(ch, method, properties, task, error):
+    """Queue a failed task again, up to task_retries times, then report its part as failed so the run can finish."""
+    attempts = (properties.headers or {}).get('attempts', 0) + 1
+    if attempts <= task_retries:
+        print(f"Failed to process task {task} (attempt {attempts}): {error}, queueing it again")
+        ch.basic_publish(exchange='', routing_key=task_queue, body=json.dumps(task), properties=pika.BasicProperties(
+            delivery_mode=2,  # Make message persistent
+            content_type='application/json',
+            headers={'attempts': attempts},
+        ))
+    else:
+        print(f"Giving up on task {task} after {attempts} attempts: {error}")
+        announce_run(task['run_id'])
+        send_completion_message(task, 0, error=str(error))
+        publisher.flush()
+    ch.basic_ack(delivery_tag=method.delivery_tag)
+
+def announce_run(run):
+    """Announce a run the first time this worker publishes for it, so the plotter starts consuming its queues."""
+    if run in announced_runs:
+        return
+    publisher.publish(runs_queue, json.dumps({'run_id': run}), pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_type='application/json',
+    ))
+    announced_runs.add(run)
+
+def send_completion_message(task, events, error=None):
+    """Send a completion message describing a finished task, or one that failed with error, to RabbitMQ."""
+    publisher.flush()  # Only report completion once the broker holds the result
+    completion = {key: task[key] for key in ('run_id', 'group', 'task_index', 'task_count')}
+    completion['events'] = events
+    if error is not None:
+        completion['error'] = error
+    publisher.publish(run_queue(task['run_id'], 'completion_queue'), json.dumps(completion), pika.BasicProperties(
+        delivery_mode=2,  # Make message persistent
+        content_type='application/json',
+    ))
+
+def start_consuming():
+    """Pull tasks from the work queue one at a time."""
+    connection = connect_to_rabbitmq()
+    channel = connection.channel()
+    channel.queue_declare(queue=task_queue, durable=True)
+    channel.basic_qos(prefetch_count=1)  # Don't take a new task until this one is acknowledged
+    channel.basic_consume(queue=task_queue, on_message_callback=task_callback)
+    print('Waiting for tasks. To exit press CTRL+C')
+    channel.start_consuming()
+
+if __name__ == "__main__":
+    metrics.serve()
+    start_consuming()
@@ -5,6 +5,9 @@
 
 
 import sys
+import os # for the number of available cores
+import multiprocessing # to read files in parallel
+from concurrent.futures import ProcessPoolExecutor # pool of worker processes
 
 
 import uproot # for reading .root files
@@ -18,6 +21,7 @@ from matplotlib.ticker import AutoMinorLocator # for minor ticks
 
 
 import infofile # local file containing cross-sections, sums of weights, dataset IDs
+import branches # local file working out which branches each sample needs
 
 
 # In[20]:
@@ -30,6 +34,8 @@ import infofile # local file containing cross-sections, sums of weights, dataset
 lumi = 10 # fb-1 # data_A,data_B,data_C,data_D
 
 fraction = 1.0 # reduce this is if you want the code to run quicker
+
+workers = int(os.getenv('HZZ_WORKERS', str(os.cpu_count() or 1))) # number of files read in parallel, set to 1 to read them one at a time
                                                                                                                                   
 #tuple_path = "Input/4lep/" # local 
 tuple_path = "https://atlas-opendata.web.cern.ch/atlas-opendata/samples/2020/4lep/" # web address
@@ -75,16 +81,28 @@ GeV = 1.0
 def get_data_from_files():
 
     data = {} # define empty dictionary to hold awkward arrays
+    tasks = [] # (sample, file name) for every file to read
     for s in samples: # loop over samples
-        print('Processing '+s+' samples') # print which sample
-        frames = [] # define empty list to hold data
         for val in samples[s]['list']: # loop over each file
             if s == 'data': prefix = "Data/" # Data prefix
             else: # MC prefix
                 prefix = "MC/mc_"+str(infofile.infos[val]["DSID"])+"."
             fileString = tuple_path+prefix+val+".4lep.root" # file name to open
-            temp = read_file(fileString,val) # call the function read_file defined below
-            frames.append(temp) # append array returned from read_file to list of awkward arrays
+            tasks.append((s, val, fileString))
+
+    print('Processing '+str(len(tasks))+' files with '+str(workers)+' workers') # print how much work there is
+    paths = [fileString for _, _, fileString in tasks]
+    vals = [val for _, val, _ in tasks]
+    if workers <= 1: # read the files one at a time
+        results = [read_file(fileString, val) for fileString, val in zip(paths, vals)]
+    else: # every file is independent, so read them all at once in worker processes
+        # fork so the workers don't re-run this script from the top
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                 mp_context=multiprocessing.get_context('fork')) as pool:
+            results = list(pool.map(read_file, paths, vals)) # results come back in submission order
+
+    for s in samples: # loop over samples
+        frames = [result for (sample, _, _), result in zip(tasks, results) if sample == s] # arrays from this sample's files, in file order
         data[s] = ak.concatenate(frames) # dictionary entry is concatenated awkward arrays
     
     return data # return dictionary of awkward arrays
@@ -157,12 +175,7 @@ def read_file(path,sample):
     with uproot.open(path + ":mini") as tree:
         numevents = tree.num_entries # number of events
         if 'data' not in sample: xsec_weight = get_xsec_weight(sample) # get cross-section weight
-        for data in tree.iterate(['lep_pt','lep_eta','lep_phi',
-                                  'lep_E','lep_charge','lep_type', 
-                                  # add more variables here if you make cuts on them 
-                                  'mcWeight','scaleFactor_PILEUP',
-                                  'scaleFactor_ELE','scaleFactor_MUON',
-                                  'scaleFactor_LepTRIGGER'], # variables to calculate Monte Carlo weight
+        for data in tree.iterate(branches.plan(sample), # variables needed by the cuts, weights and observables in branches.py
                                  library="ak", # choose output type as awkward array
                                  entry_stop=numevents*fraction): # process up to numevents*fraction
 